@@ -5,15 +5,9 @@ Cross-platform data wiping application
 """
 
 import sys
-import os
 import platform
 import logging
 
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from src.core.disk_manager import DiskManager
-from src.gui.enhanced_main_window import EnhancedMainWindow
 from src.utils.logger import setup_logger
 from src.core.sudo_manager import SudoManager
 
@@ -58,16 +52,17 @@ def main():
         sys.exit(1)
     
     try:
-        disk_manager = DiskManager()
-        
         if len(sys.argv) > 1 and sys.argv[1] == '--cli':
             sys.argv.pop(1)
             from src.cli.cli_interface import CLIInterface
-            cli = CLIInterface(disk_manager)
+            # The CLI creates its DiskManager only for commands that need one
+            cli = CLIInterface()
             cli.run()
         else:
             # Always use enhanced GUI (default)
-            app = EnhancedMainWindow(disk_manager)
+            from src.core.disk_manager import DiskManager
+            from src.gui.enhanced_main_window import EnhancedMainWindow
+            app = EnhancedMainWindow(DiskManager())
             app.run()
             
     except Exception as e:
@@ -24,7 +24,8 @@ setup(
     long_description=read_readme(),
     long_description_content_type="text/markdown",
     url="https://github.com/diskwipeout/disk-wipeout",
-    packages=find_packages(),
+    packages=find_packages(include=["src", "src.*"]),
+    py_modules=["main"],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: End Users/Desktop",
@@ -4,64 +4,433 @@ Provides CLI access to disk wiping functionality
 """
 
 import argparse
+import contextlib
+import functools
+import io
+import os
+import re
+import select
 import sys
+import threading
+import time
 import logging
-from typing import List
-from datetime import datetime
+import types
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional
 
-from ..core.disk_manager import DiskManager
-from ..core.models import DiskInfo, DiskType, DiskStatus, WipeMethod, HPADCOInfo
-from ..core.certificate_generator import generate_wipe_certificate
+if TYPE_CHECKING:
+    from ..core.disk_manager import DiskManager
 
 logger = logging.getLogger(__name__)
 
+# Human-readable descriptions of the wipe methods, keyed by method name (read-only)
+_METHOD_DESCRIPTIONS = types.MappingProxyType({
+    'secure': 'Multi-pass secure wipe (recommended for sensitive data)',
+    'quick': 'Single-pass quick wipe (faster, less secure; full TRIM on SSDs)',
+    'dd': 'DD-based wiping with random data (very secure)',
+    'cipher': 'Windows Cipher.exe free space wipe (Windows only)',
+    'hdparm': 'Linux hdparm secure erase (hardware-level, HDDs)',
+    'nvme': 'NVMe secure format (SSD-specific, very fast)',
+    'blkdiscard': 'TRIM-based discard (SSD-optimized, fast)',
+    'saf': 'Android Storage Access Framework (Android only)'
+})
+
+# Method names accepted by the wipe commands
+_WIPE_METHODS = sorted(_METHOD_DESCRIPTIONS)
+
+# Overwrite methods that --assume-encrypted-ok may replace with a LUKS header erase
+_OVERWRITE_METHODS = frozenset({'dd', 'secure', 'quick'})
+
+# Accepted answers to a (yes/no) confirmation prompt
+_AFFIRMATIVE = frozenset({'yes', 'Yes', 'YES'})
+
+# The only accepted answer to the DCO removal prompt
+_DCO_CONFIRMATION = frozenset({'YES I UNDERSTAND'})
+
+# Seconds a confirmation prompt waits for an answer before refusing, so an
+# unattended run with an idle stdin cannot hang
+_CONFIRM_TIMEOUT = 300
+
+# Heading of the tool availability report
+_TOOL_HEADER = "\n🔧 Tool Availability Report\n" + "=" * 50
+
+# Fixed trailer printed after a certificate has been generated
+_CERTIFICATE_DETAILS = """
+📋 Certificate Details:
+  • NIST SP 800-88 Rev. 1 Compliant
+  • Unique Certificate ID generated
+  • Complete device information captured
+  • Sanitization details documented
+  • Verification results included
+  • Digital signature and checksum
+
+🎉 Certificate generation complete!"""
+
+# Result banner (header, closing line) of a single-disk wipe, indexed by success
+_RESULT_BANNERS = (
+    ("❌ ERROR", "💥 Disk wipe failed!"),
+    ("✅ SUCCESS", "🎉 Disk wipe completed successfully!"),
+)
+
+# Prefix of a one-line operation result, indexed by success
+_RESULT_MARKS = ("✗", "✓")
+
+# Binary units for _humanize, one per power of 1024
+_BYTE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB", "PiB")
+
+# Assumed duration of the wipe a standalone certificate is generated for
+_CERTIFICATE_WINDOW = timedelta(seconds=30)
+
+# Classifies a wipe result line in one pass: group 1 is set for lines reporting
+# success (checked first), group 2 for lines reporting a failure
+_RESULT_CLASSIFIER = re.compile(r'(?=.*(success|removed))|(?=.*(fail|error))|', re.IGNORECASE)
+
+# Disk type names that the usage estimate treats as solid-state
+_SOLID_STATE_TYPES = frozenset({'ssd', 'nvme'})
+
+# GB (GiB) per 512-byte sector; a power of two, so the conversion is exact
+_SECTORS_TO_GB = 512 / (1 << 30)
+
+# Disk table status for each analyzer safety level; other levels fall back
+# to the writability check
+_SAFETY_STATUS = {
+    'critical': "🚨 CRITICAL",
+    'dangerous': "🔒 PROTECTED",
+    'warning': "⚠️ WARNING",
+    'safe': "✅ SAFE",
+}
+
+# Row template for the disk table; the model column is truncated to 24 chars
+_DISK_ROW = "{:<18} {:<12} {:<8} {:<25.24} {:<12} {:<10} {:<12}".format
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be greater than zero"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {number}")
+    return number
+
+
+def _non_negative_int(value: str) -> int:
+    """argparse type for counts that may be zero but not negative"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, got {number}")
+    return number
+
+
+def _p_none(parser: argparse.ArgumentParser):
+    """Subcommand without arguments"""
+
+
+def _p_device(parser: argparse.ArgumentParser):
+    """Subcommand taking a single device path"""
+    parser.add_argument('device', help='Device path (e.g., /dev/sdb)')
+
+
+def _p_wipe(parser: argparse.ArgumentParser):
+    """Arguments for the wipe command"""
+    parser.add_argument('device', nargs='+', help='Device path(s) to wipe')
+    parser.add_argument('-m', '--method', default='secure', choices=_WIPE_METHODS,
+                        help='Wipe method (default: secure)')
+    parser.add_argument('-p', '--passes', type=int, default=3,
+                        help='Number of passes (default: 3)')
+    parser.add_argument('--no-verify', action='store_true',
+                        help='Skip verification after wipe')
+    parser.add_argument('-f', '--force', action='store_true',
+                        help='Force wipe without confirmation')
+    parser.add_argument('-j', '--max-parallel', type=_positive_int, default=None, metavar='N',
+                        help='Wipe at most N devices at once (default: all)')
+    parser.add_argument('--assume-encrypted-ok', action='store_true',
+                        help='On LUKS-encrypted devices, erase only the LUKS header and '
+                             'keyslots (cryptographic erase) instead of overwriting')
+
+
+def _p_remove_area(parser: argparse.ArgumentParser):
+    """Arguments for the remove-hpa and remove-dco commands"""
+    parser.add_argument('device', help='Device path')
+    parser.add_argument('-f', '--force', action='store_true',
+                        help='Force removal without confirmation')
+
+
+def _p_wipe_full(parser: argparse.ArgumentParser):
+    """Arguments for the wipe-full command"""
+    parser.add_argument('device', help='Device path to wipe')
+    parser.add_argument('-m', '--method', default='secure', choices=_WIPE_METHODS,
+                        help='Wipe method (default: secure)')
+    parser.add_argument('-p', '--passes', type=int, default=3,
+                        help='Number of passes (default: 3)')
+    parser.add_argument('--no-verify', action='store_true',
+                        help='Skip verification after wipe')
+    parser.add_argument('--remove-hpa', action='store_true',
+                        help='Remove HPA before wiping')
+    parser.add_argument('--remove-dco', action='store_true',
+                        help='Remove DCO before wiping (DANGEROUS)')
+    parser.add_argument('-f', '--force', action='store_true',
+                        help='Force wipe without confirmation')
+
+
+def _p_certificate(parser: argparse.ArgumentParser):
+    """Arguments for the certificate command"""
+    parser.add_argument('device', help='Device path that was wiped')
+    parser.add_argument('-m', '--method', default='quick',
+                        help='Wipe method used (default: quick)')
+    parser.add_argument('-p', '--passes', type=int, default=1,
+                        help='Number of passes used (default: 1)')
+    parser.add_argument('--success', action='store_true', default=True,
+                        help='Operation was successful (default: True)')
+    parser.add_argument('--bytes', type=_non_negative_int, default=0,
+                        help='Bytes written during wipe (default: 0)')
+
+
+# Subcommand name -> (help text, function adding its arguments)
+_SUBCOMMANDS = {
+    'list': ('List available disks', _p_none),
+    'refresh': ('Refresh disk list and update device information', _p_none),
+    'info': ('Show disk information', _p_device),
+    'analyze': ('Show intelligent disk analysis', _p_device),
+    'wipe': ('Wipe a disk', _p_wipe),
+    'methods': ('Show available wipe methods', _p_none),
+    'detect-hpa': ('Detect HPA/DCO on a disk', _p_device),
+    'remove-hpa': ('Remove Host Protected Area from disk', _p_remove_area),
+    'remove-dco': ('Remove Device Configuration Overlay from disk', _p_remove_area),
+    'wipe-full': ('Wipe disk with optional HPA/DCO removal', _p_wipe_full),
+    'tools': ('Show tool availability and version info', _p_none),
+    'certificate': ('Generate NIST-compliant certificate for a wipe operation', _p_certificate),
+}
+
+# Commands simple enough to be parsed without argparse: bare, or taking one device
+_FAST_BARE = frozenset({'list', 'refresh', 'methods', 'tools'})
+_FAST_DEVICE = frozenset({'info', 'analyze', 'detect-hpa'})
+
+
+def _sniff_command(argv: List[str]) -> Optional[str]:
+    """Return the subcommand named in argv, or None if help or no known command is requested"""
+    for arg in argv:
+        if arg in ('-h', '--help'):
+            return None
+        if not arg.startswith('-'):
+            return arg if arg in _SUBCOMMANDS else None
+    return None
+
+
+def _fast_args(argv: List[str]) -> Optional[argparse.Namespace]:
+    """Parse the common flag-free invocations without argparse, or return None"""
+    if len(argv) == 1 and argv[0] in _FAST_BARE:
+        return argparse.Namespace(command=argv[0], verbose=False, quiet=False)
+    if len(argv) == 2 and argv[0] in _FAST_DEVICE and not argv[1].startswith('-'):
+        return argparse.Namespace(command=argv[0], device=argv[1], verbose=False, quiet=False)
+    return None
+
+
+def _read_answer(timeout: float) -> Optional[str]:
+    """Read one line from stdin, or None on timeout or end of input"""
+    try:
+        fd = sys.stdin.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        fd = None
+    if fd is None or os.name == 'nt':
+        # select cannot wait on this stdin; fall back to a blocking read
+        try:
+            return input()
+        except EOFError:
+            return None
+    
+    # Read the fd a byte at a time so no later answer is left in Python's
+    # stdin buffer where select cannot see it
+    deadline = time.monotonic() + timeout
+    answer = bytearray()
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+            return None
+        byte = os.read(fd, 1)
+        if not byte:
+            return answer.decode(errors='replace') if answer else None
+        if byte == b'\n':
+            return answer.decode(errors='replace')
+        answer += byte
+
+
+def _confirm(prompt: str, accepted: FrozenSet[str] = _AFFIRMATIVE) -> bool:
+    """Ask a confirmation question; True if the answer is one of the accepted ones"""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    answer = _read_answer(_CONFIRM_TIMEOUT)
+    if answer is None:
+        print("\nNo confirmation received - aborting")
+        return False
+    return answer in accepted
+
+
+def _humanize(n: int) -> str:
+    """Format a byte count with the largest fitting binary unit, e.g. '1.82 TiB'"""
+    if n < 0:
+        raise ValueError(f"byte count cannot be negative: {n}")
+    shift = min(max(n.bit_length() - 1, 0) // 10, len(_BYTE_UNITS) - 1)
+    if not shift:
+        return f"{n} B"
+    return f"{n / (1 << (10 * shift)):.2f} {_BYTE_UNITS[shift]}"
+
+
+def _write_lines(lines: List[str]):
+    """Write a block of output lines to stdout with a single write call"""
+    text = "\n".join(lines) + "\n"
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        # Redirected to an in-memory stream; no file descriptor to write to
+        sys.stdout.write(text)
+        return
+    
+    # The Windows console and non-UTF-8 terminals need the text layer's own
+    # encoding and newline handling
+    encoding = (sys.stdout.encoding or '').lower().replace('_', '-')
+    if os.name == 'nt' or (sys.stdout.isatty() and encoding not in ('utf-8', 'utf8')):
+        sys.stdout.write(text)
+        return
+
+    # Encode the block once and hand it to the fd directly, after flushing
+    # anything print() left buffered so the output stays in order
+    data = text.encode(sys.stdout.encoding or 'utf-8', errors='replace')
+    sys.stdout.flush()
+    while data:
+        data = data[os.write(fd, data):]
+
+
+class _PerThreadStdout:
+    """stdout stand-in that diverts each capturing thread's output to its own buffer"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    @contextlib.contextmanager
+    def capture(self):
+        """Buffer the calling thread's output for the duration of the block"""
+        self._local.buffer = io.StringIO()
+        try:
+            yield self._local.buffer
+        finally:
+            del self._local.buffer
+    
+    def write(self, text: str) -> int:
+        return getattr(self._local, 'buffer', self.stream).write(text)
+    
+    def flush(self):
+        getattr(self._local, 'buffer', self.stream).flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+@contextlib.contextmanager
+def _per_thread_stdout():
+    """Install a _PerThreadStdout as sys.stdout for the block, restoring the real stream after"""
+    output = _PerThreadStdout(sys.stdout)
+    sys.stdout = output
+    try:
+        yield output
+    finally:
+        sys.stdout = output.stream
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(command: Optional[str]) -> argparse.ArgumentParser:
+    """
+    Build the argument parser for one subcommand, or for all of them when
+    command is None. Parsers are cached; argparse parsers are reusable.
+    """
+    parser = argparse.ArgumentParser(
+        description="Disk Wipeout - Secure Data Erasure Tool",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s list                    # List available disks
+  %(prog)s refresh                 # Refresh disk list and scan for new devices
+  %(prog)s info /dev/sdb           # Show disk information
+  %(prog)s wipe /dev/sdb --method dd --passes 3  # Wipe disk with 3 passes
+  %(prog)s methods                 # Show available wipe methods
+        """
+    )
+
+    # Global options
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Enable verbose output')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='Suppress non-error output')
+
+    # Subcommands
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    for name, (help_text, configure) in _SUBCOMMANDS.items():
+        if command is None or name == command:
+            configure(subparsers.add_parser(name, help=help_text))
+
+    return parser
+
+
 class CLIInterface:
     """Command-line interface for the disk wiping application"""
     
-    def __init__(self, disk_manager: DiskManager):
-        self.disk_manager = disk_manager
+    def __init__(self, disk_manager: Optional["DiskManager"] = None):
+        self._disk_manager = disk_manager
+
+        # HPA/DCO detection results for this invocation, keyed by device
+        self._hpa_dco_cache: Dict[str, dict] = {}
+
+        # Subcommand name -> handler taking the parsed arguments
+        self._dispatch = {
+            'list': lambda a: self._list_disks(),
+            'refresh': lambda a: self._refresh_disks(),
+            'info': lambda a: self._show_disk_info(a.device),
+            'analyze': lambda a: self._show_intelligent_analysis(a.device),
+            'wipe': lambda a: self._wipe_disks(a.device, a.method, a.passes,
+                                               not a.no_verify, a.force, a.max_parallel,
+                                               a.assume_encrypted_ok),
+            'methods': lambda a: self._show_wipe_methods(),
+            'detect-hpa': lambda a: self._detect_hpa_dco(a.device),
+            'remove-hpa': lambda a: self._remove_hpa(a.device, a.force),
+            'remove-dco': lambda a: self._remove_dco(a.device, a.force),
+            'wipe-full': lambda a: self._wipe_with_hpa_dco(a.device, a.method, a.passes,
+                                                           not a.no_verify, a.remove_hpa,
+                                                           a.remove_dco, a.force),
+            'tools': lambda a: self._show_tool_info(),
+            'certificate': lambda a: self._generate_certificate(a.device, a.method, a.passes,
+                                                                a.success, a.bytes),
+        }
+    
+    @property
+    def disk_manager(self) -> "DiskManager":
+        """Disk manager used by the commands, created on first use if none was given"""
+        if self._disk_manager is None:
+            from ..core.disk_manager import DiskManager
+            self._disk_manager = DiskManager()
+        return self._disk_manager
     
     def run(self):
         """Run the CLI interface"""
-        parser = self._create_parser()
-        args = parser.parse_args()
+        argv = sys.argv[1:]
+        args = _fast_args(argv)
+        if args is None:
+            args = self._create_parser(argv).parse_args(argv)
         
         # Configure logging level
-        if args.verbose:
-            logging.getLogger().setLevel(logging.DEBUG)
-        elif args.quiet:
-            logging.getLogger().setLevel(logging.WARNING)
+        if args.verbose or args.quiet:
+            logging.getLogger().setLevel(logging.DEBUG if args.verbose else logging.WARNING)
         
         try:
-            if args.command == 'list':
-                self._list_disks()
-            elif args.command == 'refresh':
-                self._refresh_disks()
-            elif args.command == 'info':
-                self._show_disk_info(args.device)
-            elif args.command == 'analyze':
-                self._show_intelligent_analysis(args.device)
-            elif args.command == 'wipe':
-                self._wipe_disk(args.device, args.method, args.passes, not args.no_verify, args.force)
-            elif args.command == 'methods':
-                self._show_wipe_methods()
-            elif args.command == 'detect-hpa':
-                self._detect_hpa_dco(args.device)
-            elif args.command == 'remove-hpa':
-                self._remove_hpa(args.device, args.force)
-            elif args.command == 'remove-dco':
-                self._remove_dco(args.device, args.force)
-            elif args.command == 'wipe-full':
-                self._wipe_with_hpa_dco(args.device, args.method, args.passes,
-                                       not args.no_verify, args.remove_hpa,
-                                       args.remove_dco, args.force)
-            elif args.command == 'tools':
-                self._show_tool_info()
-            elif args.command == 'certificate':
-                self._generate_certificate(args.device, args.method, args.passes, 
-                                         args.success, args.bytes)
+            handler = self._dispatch.get(args.command)
+            if handler:
+                handler(args)
             else:
-                parser.print_help()
+                self._create_parser(argv).print_help()
                 
         except KeyboardInterrupt:
             print("\nOperation cancelled by user")
@@ -70,202 +439,111 @@ class CLIInterface:
             print(f"Error: {e}")
             sys.exit(1)
     
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """Create command-line argument parser"""
-        parser = argparse.ArgumentParser(
-            description="Disk Wipeout - Secure Data Erasure Tool",
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-Examples:
-  %(prog)s list                    # List available disks
-  %(prog)s refresh                 # Refresh disk list and scan for new devices
-  %(prog)s info /dev/sdb           # Show disk information
-  %(prog)s wipe /dev/sdb --method dd --passes 3  # Wipe disk with 3 passes
-  %(prog)s methods                 # Show available wipe methods
-            """
-        )
-        
-        # Global options
-        parser.add_argument('-v', '--verbose', action='store_true',
-                          help='Enable verbose output')
-        parser.add_argument('-q', '--quiet', action='store_true',
-                          help='Suppress non-error output')
-        
-        # Subcommands
-        subparsers = parser.add_subparsers(dest='command', help='Available commands')
-        
-        # List command
-        list_parser = subparsers.add_parser('list', help='List available disks')
-        
-        # Refresh command
-        refresh_parser = subparsers.add_parser('refresh', help='Refresh disk list and update device information')
-        
-        # Info command
-        info_parser = subparsers.add_parser('info', help='Show disk information')
-        info_parser.add_argument('device', help='Device path (e.g., /dev/sdb)')
-        
-        # Analyze command
-        analyze_parser = subparsers.add_parser('analyze', help='Show intelligent disk analysis')
-        analyze_parser.add_argument('device', help='Device path (e.g., /dev/sdb)')
-        
-        # Wipe command
-        wipe_parser = subparsers.add_parser('wipe', help='Wipe a disk')
-        wipe_parser.add_argument('device', help='Device path to wipe')
-        wipe_parser.add_argument('-m', '--method', default='secure',
-                               help='Wipe method (default: secure)')
-        wipe_parser.add_argument('-p', '--passes', type=int, default=3,
-                               help='Number of passes (default: 3)')
-        wipe_parser.add_argument('--no-verify', action='store_true',
-                               help='Skip verification after wipe')
-        wipe_parser.add_argument('-f', '--force', action='store_true',
-                               help='Force wipe without confirmation')
-        
-        # Methods command
-        methods_parser = subparsers.add_parser('methods', help='Show available wipe methods')
-
-        # HPA/DCO detection command
-        detect_parser = subparsers.add_parser('detect-hpa',
-                                             help='Detect HPA/DCO on a disk')
-        detect_parser.add_argument('device', help='Device path (e.g., /dev/sdb)')
-
-        # Remove HPA command
-        remove_hpa_parser = subparsers.add_parser('remove-hpa',
-                                                 help='Remove Host Protected Area from disk')
-        remove_hpa_parser.add_argument('device', help='Device path')
-        remove_hpa_parser.add_argument('-f', '--force', action='store_true',
-                                      help='Force removal without confirmation')
-
-        # Remove DCO command
-        remove_dco_parser = subparsers.add_parser('remove-dco',
-                                                 help='Remove Device Configuration Overlay from disk')
-        remove_dco_parser.add_argument('device', help='Device path')
-        remove_dco_parser.add_argument('-f', '--force', action='store_true',
-                                      help='Force removal without confirmation')
-
-        # Full wipe with HPA/DCO removal
-        full_wipe_parser = subparsers.add_parser('wipe-full',
-                                                help='Wipe disk with optional HPA/DCO removal')
-        full_wipe_parser.add_argument('device', help='Device path to wipe')
-        full_wipe_parser.add_argument('-m', '--method', default='secure',
-                                     help='Wipe method (default: secure)')
-        full_wipe_parser.add_argument('-p', '--passes', type=int, default=3,
-                                     help='Number of passes (default: 3)')
-        full_wipe_parser.add_argument('--no-verify', action='store_true',
-                                     help='Skip verification after wipe')
-        full_wipe_parser.add_argument('--remove-hpa', action='store_true',
-                                     help='Remove HPA before wiping')
-        full_wipe_parser.add_argument('--remove-dco', action='store_true',
-                                     help='Remove DCO before wiping (DANGEROUS)')
-        full_wipe_parser.add_argument('-f', '--force', action='store_true',
-                                     help='Force wipe without confirmation')
-
-        # Tools info command
-        tools_parser = subparsers.add_parser('tools',
-                                            help='Show tool availability and version info')
-
-        # Certificate generation command
-        cert_parser = subparsers.add_parser('certificate',
-                                           help='Generate NIST-compliant certificate for a wipe operation')
-        cert_parser.add_argument('device', help='Device path that was wiped')
-        cert_parser.add_argument('-m', '--method', default='quick',
-                                help='Wipe method used (default: quick)')
-        cert_parser.add_argument('-p', '--passes', type=int, default=1,
-                                help='Number of passes used (default: 1)')
-        cert_parser.add_argument('--success', action='store_true', default=True,
-                                help='Operation was successful (default: True)')
-        cert_parser.add_argument('--bytes', type=int, default=0,
-                                help='Bytes written during wipe (default: 0)')
-
-        return parser
+    def _create_parser(self, argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+        """
+        Create command-line argument parser
+
+        Only the subcommand named in argv gets its subparser built; the full
+        set is constructed for top-level help or an unrecognised command.
+        """
+        return _build_parser(_sniff_command(sys.argv[1:] if argv is None else argv))
     
+    def _hpa_dco(self, device: str) -> dict:
+        """Detect HPA/DCO on a device, reusing an earlier result from this invocation"""
+        if device not in self._hpa_dco_cache:
+            self._hpa_dco_cache[device] = self.disk_manager.detect_hpa_dco(device)
+        return self._hpa_dco_cache[device]
+
     def _detect_hpa_dco(self, device: str):
         """Detect and display HPA/DCO information for a disk"""
         print(f"\nDetecting HPA/DCO on {device}...")
         print("=" * 50)
 
-        hpa_dco_info = self.disk_manager.detect_hpa_dco(device)
+        hpa_dco_info = self._hpa_dco(device)
 
         if hpa_dco_info.get('error'):
             print(f"Error: {hpa_dco_info['error']}")
             return
 
-        # Display detection results
-        print(f"Detection Method: {hpa_dco_info.get('detection_method', 'N/A')}")
-        print(f"\nSector Information:")
-        print(f"  Current Max Sectors: {hpa_dco_info.get('current_max_sectors', 0):,}")
-        print(f"  Native Max Sectors:  {hpa_dco_info.get('native_max_sectors', 0):,}")
-        print(f"  Accessible Sectors:  {hpa_dco_info.get('accessible_sectors', 0):,}")
-
-        if hpa_dco_info.get('hpa_detected'):
-            hidden_sectors = hpa_dco_info.get('hpa_sectors', 0)
-            hidden_gb = (hidden_sectors * 512) / (1024**3)
-            print(f"\n⚠️  HPA DETECTED!")
-            print(f"  Hidden Sectors: {hidden_sectors:,}")
-            print(f"  Hidden Size: {hidden_gb:.2f} GB")
-            print(f"  Can Remove: {'Yes' if hpa_dco_info.get('can_remove_hpa') else 'No'}")
-        else:
-            print(f"\n✓ No HPA detected")
-
-        if hpa_dco_info.get('dco_detected'):
-            dco_sectors = hpa_dco_info.get('dco_sectors', 0)
-            dco_gb = (dco_sectors * 512) / (1024**3)
-            print(f"\n⚠️  DCO DETECTED!")
-            print(f"  DCO Sectors: {dco_sectors:,}")
-            print(f"  DCO Size: {dco_gb:.2f} GB")
-            print(f"  Can Remove: {'Yes' if hpa_dco_info.get('can_remove_dco') else 'No'}")
+        _write_lines(self._format_hpa_dco(hpa_dco_info))
+
+    @staticmethod
+    def _format_hpa_dco(hpa_dco_info: dict) -> List[str]:
+        """Format HPA/DCO detection results as report lines"""
+        get = hpa_dco_info.get
+        lines = [
+            f"Detection Method: {get('detection_method', 'N/A')}",
+            "\nSector Information:",
+            f"  Current Max Sectors: {get('current_max_sectors', 0):,}",
+            f"  Native Max Sectors:  {get('native_max_sectors', 0):,}",
+            f"  Accessible Sectors:  {get('accessible_sectors', 0):,}",
+        ]
+
+        if get('hpa_detected'):
+            hidden_sectors = get('hpa_sectors', 0)
+            hidden_gb = hidden_sectors * _SECTORS_TO_GB
+            lines.append("\n⚠️  HPA DETECTED!")
+            lines.append(f"  Hidden Sectors: {hidden_sectors:,}")
+            lines.append(f"  Hidden Size: {hidden_gb:.2f} GB")
+            lines.append(f"  Can Remove: {'Yes' if get('can_remove_hpa') else 'No'}")
         else:
-            print(f"\n✓ No DCO detected")
+            lines.append("\n✓ No HPA detected")
 
-        print("\n" + "=" * 50)
+        if get('dco_detected'):
+            dco_sectors = get('dco_sectors', 0)
+            dco_gb = dco_sectors * _SECTORS_TO_GB
+            lines.append("\n⚠️  DCO DETECTED!")
+            lines.append(f"  DCO Sectors: {dco_sectors:,}")
+            lines.append(f"  DCO Size: {dco_gb:.2f} GB")
+            lines.append(f"  Can Remove: {'Yes' if get('can_remove_dco') else 'No'}")
+        else:
+            lines.append("\n✓ No DCO detected")
 
+        lines.append("\n" + "=" * 50)
+        return lines
+    
     def _remove_hpa(self, device: str, force: bool = False):
         """Remove HPA from disk"""
-        if not force:
-            response = input(f"\n⚠️  WARNING: Removing HPA from {device} will expose hidden areas.\n"
-                           "This may contain sensitive data. Continue? (yes/no): ")
-            if response.lower() != 'yes':
-                print("Operation cancelled.")
-                return
+        if not force and not _confirm(f"\n⚠️  WARNING: Removing HPA from {device} will expose hidden areas.\n"
+                                      "This may contain sensitive data. Continue? (yes/no): "):
+            print("Operation cancelled.")
+            return
 
         print(f"\nRemoving HPA from {device}...")
         success, message = self.disk_manager.remove_hpa(device)
+        self._hpa_dco_cache.pop(device, None)
 
-        if success:
-            print(f"✓ {message}")
-        else:
-            print(f"✗ {message}")
+        print(f"{_RESULT_MARKS[bool(success)]} {message}")
 
     def _remove_dco(self, device: str, force: bool = False):
         """Remove DCO from disk"""
-        if not force:
-            response = input(f"\n⚠️  DANGER: Removing DCO from {device} can permanently damage the disk!\n"
-                           "This operation is irreversible. Are you absolutely sure? (type 'YES I UNDERSTAND'): ")
-            if response != 'YES I UNDERSTAND':
-                print("Operation cancelled.")
-                return
+        if not force and not _confirm(f"\n⚠️  DANGER: Removing DCO from {device} can permanently damage the disk!\n"
+                                      "This operation is irreversible. Are you absolutely sure? (type 'YES I UNDERSTAND'): ",
+                                      _DCO_CONFIRMATION):
+            print("Operation cancelled.")
+            return
 
         print(f"\nRemoving DCO from {device}...")
         success, message = self.disk_manager.remove_dco(device)
+        self._hpa_dco_cache.pop(device, None)
 
-        if success:
-            print(f"✓ {message}")
-        else:
-            print(f"✗ {message}")
+        print(f"{_RESULT_MARKS[bool(success)]} {message}")
 
     def _wipe_with_hpa_dco(self, device: str, method: str, passes: int,
                           verify: bool, remove_hpa: bool, remove_dco: bool, force: bool):
         """Wipe disk with optional HPA/DCO removal"""
         # First detect HPA/DCO
         print(f"\nScanning {device} for hidden areas...")
-        hpa_dco_info = self.disk_manager.detect_hpa_dco(device)
+        hpa_dco_info = self._hpa_dco(device)
+        get = hpa_dco_info.get
 
         warnings = []
-        if hpa_dco_info.get('hpa_detected'):
-            hidden_gb = (hpa_dco_info.get('hpa_sectors', 0) * 512) / (1024**3)
+        if get('hpa_detected'):
+            hidden_gb = get('hpa_sectors', 0) * _SECTORS_TO_GB
             warnings.append(f"HPA detected: {hidden_gb:.2f}GB hidden")
 
-        if hpa_dco_info.get('dco_detected'):
-            dco_gb = (hpa_dco_info.get('dco_sectors', 0) * 512) / (1024**3)
+        if get('dco_detected'):
+            dco_gb = get('dco_sectors', 0) * _SECTORS_TO_GB
             warnings.append(f"DCO detected: {dco_gb:.2f}GB hidden")
 
         if warnings:
@@ -274,32 +552,35 @@ Examples:
                 print(f"  ⚠️  {warning}")
 
         if not force:
-            print(f"\nYou are about to wipe {device}")
+            prompt = [f"\nYou are about to wipe {device}"]
             if remove_hpa:
-                print("  - HPA will be removed")
+                prompt.append("  - HPA will be removed")
             if remove_dco:
-                print("  - DCO will be removed (DANGEROUS!)")
-            print(f"  - Method: {method}")
-            print(f"  - Passes: {passes}")
+                prompt.append("  - DCO will be removed (DANGEROUS!)")
+            prompt.append(f"  - Method: {method}")
+            prompt.append(f"  - Passes: {passes}")
+            prompt.append("\nThis will permanently destroy all data. Continue? (yes/no): ")
 
-            response = input("\nThis will permanently destroy all data. Continue? (yes/no): ")
-            if response.lower() != 'yes':
+            if not _confirm("\n".join(prompt)):
                 print("Operation cancelled.")
                 return
 
         print(f"\nStarting wipe operation...")
         success, message = self.disk_manager.wipe_with_hpa_dco_removal(
-            device, method, passes, verify, remove_hpa, remove_dco
+            device, method, passes, verify, remove_hpa, remove_dco,
+            hpa_dco_info=hpa_dco_info
         )
 
-        print("\nOperation Results:")
+        lines = ["\nOperation Results:"]
         for line in message.split('\n'):
-            if 'success' in line.lower() or 'removed' in line.lower():
-                print(f"  ✓ {line}")
-            elif 'fail' in line.lower() or 'error' in line.lower():
-                print(f"  ✗ {line}")
+            result = _RESULT_CLASSIFIER.match(line)
+            if result.group(1):
+                lines.append(f"  ✓ {line}")
+            elif result.group(2):
+                lines.append(f"  ✗ {line}")
             else:
-                print(f"  {line}")
+                lines.append(f"  {line}")
+        _write_lines(lines)
 
         if success:
             print("\n✓ Wipe operation completed successfully")
@@ -310,84 +591,88 @@ Examples:
         """Show tool availability and version information"""
         from ..core.tool_manager import tool_manager
 
-        print("\n🔧 Tool Availability Report")
-        print("=" * 50)
+        lines = [_TOOL_HEADER]
 
         tool_info = tool_manager.get_tool_info()
 
-        print(f"System: {tool_info['system'].title()}")
-        print(f"Architecture: {tool_info['architecture']}")
-        print(f"Edition: {'Complete' if tool_info['is_complete_edition'] else 'Lite'}")
+        lines.append(f"System: {tool_info['system'].title()}")
+        lines.append(f"Architecture: {tool_info['architecture']}")
+        lines.append(f"Edition: {'Complete' if tool_info['is_complete_edition'] else 'Lite'}")
 
         if tool_info['tools_directory']:
-            print(f"Tools Directory: {tool_info['tools_directory']}")
+            lines.append(f"Tools Directory: {tool_info['tools_directory']}")
 
-        print("\nTool Status:")
-        print("-" * 30)
+        lines.append("\nTool Status:")
+        lines.append("-" * 30)
 
         for tool_name, tool_data in tool_info['tools'].items():
             status = "✅ Available" if tool_data['available'] else "❌ Missing"
-            print(f"{tool_name:12} {status}")
+            lines.append(f"{tool_name:12} {status}")
 
             if tool_data['available']:
                 path_type = "Bundled" if tool_data['bundled_path'] and tool_data['path'] == tool_data['bundled_path'] else "System"
-                print(f"{'':14} Path: {tool_data['path']} ({path_type})")
+                lines.append(f"{'':14} Path: {tool_data['path']} ({path_type})")
             else:
-                print(f"{'':14} System command: {tool_data['system_command']}")
+                lines.append(f"{'':14} System command: {tool_data['system_command']}")
 
         # Show installation suggestions for missing tools
         missing_tools = tool_manager.get_missing_tools()
         if missing_tools and not tool_info['is_complete_edition']:
-            print("\n💡 Installation Suggestions:")
-            print("-" * 30)
+            lines.append("\n💡 Installation Suggestions:")
+            lines.append("-" * 30)
             suggestions = tool_manager.get_installation_suggestions()
             for tool, suggestion in suggestions.items():
-                print(f"{tool}: {suggestion}")
+                lines.append(f"{tool}: {suggestion}")
 
-            print("\nAlternatively, use the Complete Edition for all tools pre-bundled.")
+            lines.append("\nAlternatively, use the Complete Edition for all tools pre-bundled.")
         elif missing_tools and tool_info['is_complete_edition']:
-            print(f"\n⚠️  Some bundled tools are missing. Package may be corrupted.")
+            lines.append(f"\n⚠️  Some bundled tools are missing. Package may be corrupted.")
         else:
-            print(f"\n✅ All tools available!")
-
-        print("\n" + "=" * 50)
+            lines.append(f"\n✅ All tools available!")
 
+        lines.append("\n" + "=" * 50)
+        _write_lines(lines)
+    
     def _list_disks(self):
         """List available disks with enhanced information"""
-        print("🔍 Available Disks:")
-        print("=" * 120)
-        print(f"{'Device':<18} {'Size':<12} {'Type':<8} {'Model':<25} {'Status':<12} {'Hidden':<10} {'Usage':<12}")
-        print("=" * 120)
+        lines = []
+        lines.append("🔍 Available Disks:")
+        lines.append("=" * 120)
+        lines.append(_DISK_ROW('Device', 'Size', 'Type', 'Model', 'Status', 'Hidden', 'Usage'))
+        lines.append("=" * 120)
         
         try:
             disks = self.disk_manager.get_available_disks()
-            system_disks = self.disk_manager.get_system_disks()
             
             if not disks:
-                print("No disks found")
+                lines.append("No disks found")
                 return
             
+            # All disks come from the same handler, so probe the data model once
+            first = disks[0]
+            has_size_formatted = hasattr(first, 'size_formatted')
+            has_type_icon = hasattr(first, 'type_icon')
+            type_is_enum = hasattr(first.type, 'value')
+            has_hpa_dco_info = hasattr(first, 'hpa_dco_info')
+            
+            statuses = self.disk_manager.get_disk_status_batch([disk.device for disk in disks])
+            
             for disk in disks:
                 # Use enhanced data model if available
-                if hasattr(disk, 'size_formatted'):
+                if has_size_formatted:
                     size_str = disk.size_formatted
                 else:
                     size_str = f"{disk.size // (1024**3)}GB" if disk.size > 0 else "Unknown"
                 
                 # Get type with icon
-                if hasattr(disk, 'type_icon'):
-                    if hasattr(disk.type, 'value'):
-                        type_str = f"{disk.type_icon} {disk.type.value.upper()}"
-                    else:
-                        type_str = f"{disk.type_icon} {disk.type.upper()}"
+                type_name = disk.type.value if type_is_enum else disk.type
+                if has_type_icon:
+                    type_str = f"{disk.type_icon} {type_name.upper()}"
                 else:
-                    if hasattr(disk.type, 'value'):
-                        type_str = disk.type.value.upper()
-                    else:
-                        type_str = disk.type.upper()
+                    type_str = type_name.upper()
                 
                 # Get intelligent disk analysis
-                disk_status = self.disk_manager.get_disk_status_safe(disk.device)
+                disk_status = statuses[disk.device]
                 is_writable = disk_status['is_writable']
                 is_system_disk = disk_status['is_protected']
                 safety_level = disk_status.get('safety_level', 'unknown')
@@ -396,22 +681,13 @@ Examples:
                 confidence = disk_status.get('confidence_score', 0.0)
                 
                 # Determine status using intelligent analysis
-                if safety_level == 'critical':
-                    status = "🚨 CRITICAL"
-                elif safety_level == 'dangerous':
-                    status = "🔒 PROTECTED"
-                elif safety_level == 'warning':
-                    status = "⚠️ WARNING"
-                elif safety_level == 'safe':
-                    status = "✅ SAFE"
-                elif is_writable:
-                    status = "✅ Writable"
-                else:
-                    status = "❌ Read-only"
+                status = _SAFETY_STATUS.get(safety_level)
+                if status is None:
+                    status = "✅ Writable" if is_writable else "❌ Read-only"
                 
                 # Check for hidden areas
                 hidden_str = "None"
-                if hasattr(disk, 'hpa_dco_info') and disk.hpa_dco_info:
+                if has_hpa_dco_info and disk.hpa_dco_info:
                     # Handle both dataclass and dict formats
                     if hasattr(disk.hpa_dco_info, 'hpa_detected'):
                         if disk.hpa_dco_info.hpa_detected or disk.hpa_dco_info.dco_detected:
@@ -425,23 +701,23 @@ Examples:
                 # Calculate storage usage (simulated)
                 usage_percentage = 0
                 if not is_system_disk:  # Don't show usage for system disks
-                    # Get disk type as string
-                    disk_type_str = disk.type.value if hasattr(disk.type, 'value') else str(disk.type)
-                    if disk_type_str.lower() in ['ssd', 'nvme']:
+                    if type_name.lower() in _SOLID_STATE_TYPES:
                         usage_percentage = 25  # SSDs typically have less usage
                     else:
                         usage_percentage = 45  # HDDs typically have more usage
                 
                 usage_display = f"{usage_percentage}% Used" if usage_percentage > 0 else "N/A"
                 
-                print(f"{disk.device:<18} {size_str:<12} {type_str:<8} "
-                      f"{disk.model[:24]:<25} {status:<12} {hidden_str:<10} {usage_display:<12}")
+                lines.append(_DISK_ROW(disk.device, size_str, type_str, disk.model,
+                                       status, hidden_str, usage_display))
             
-            print("=" * 120)
-            print(f"Total: {len(disks)} disks found")
+            lines.append("=" * 120)
+            lines.append(f"Total: {len(disks)} disks found")
                       
         except Exception as e:
-            print(f"Error listing disks: {e}")
+            lines.append(f"Error listing disks: {e}")
+        finally:
+            _write_lines(lines)
     
     def _refresh_disks(self):
         """Refresh disk list and update device information"""
@@ -453,8 +729,9 @@ Examples:
             print("📡 Scanning for new devices...")
             
             # Get fresh disk list
+            self.disk_manager.refresh_system_disks()
             disks = self.disk_manager.get_available_disks()
-            system_disks = self.disk_manager.get_system_disks()
+            system_disks = self.disk_manager.system_disks
             
             print(f"✅ Found {len(disks)} disks")
             
@@ -463,9 +740,11 @@ Examples:
             writable_count = 0
             protected_count = 0
             
+            writable = self.disk_manager.is_disk_writable_batch([disk.device for disk in disks])
+            
             for disk in disks:
                 is_system_disk = disk.device in system_disks
-                is_writable = self.disk_manager.is_disk_writable(disk.device)
+                is_writable = writable[disk.device]
                 
                 if is_system_disk:
                     protected_count += 1
@@ -473,10 +752,12 @@ Examples:
                     writable_count += 1
                     
                 # Check for USB devices
-                if ("/dev/sd" in disk.device or 
-                    "USB" in disk.model.upper() or 
-                    "FLASH" in disk.model.upper()):
+                if "/dev/sd" in disk.device:
                     usb_count += 1
+                else:
+                    model_upper = disk.model.upper()
+                    if "USB" in model_upper or "FLASH" in model_upper:
+                        usb_count += 1
             
             print(f"📊 Summary:")
             print(f"   • Total disks: {len(disks)}")
@@ -490,201 +771,303 @@ Examples:
     
     def _show_disk_info(self, device: str):
         """Show comprehensive disk information"""
-        print(f"📀 Disk Information for {device}")
-        print("=" * 60)
+        lines = []
+        lines.append(f"📀 Disk Information for {device}")
+        lines.append("=" * 60)
         
         try:
             disk_info = self.disk_manager.get_disk_info(device)
             
             if not disk_info:
-                print(f"❌ Device {device} not found")
+                lines.append(f"❌ Device {device} not found")
                 return
             
             # Use enhanced data model if available
             if hasattr(disk_info, 'get_detailed_info'):
                 detailed_info = disk_info.get_detailed_info()
                 
-                print(f"Device: {detailed_info['device']}")
-                print(f"Size: {detailed_info['size']} ({detailed_info['size_bytes']:,} bytes)")
-                print(f"Type: {detailed_info['type_icon']} {detailed_info['type']}")
-                print(f"Model: {detailed_info['model']}")
-                print(f"Serial: {detailed_info['serial']}")
-                print(f"Mountpoint: {detailed_info['mountpoint']}")
-                print(f"Filesystem: {detailed_info['filesystem']}")
-                print(f"Writable: {'Yes' if detailed_info['is_writable'] else 'No'}")
-                print(f"System Disk: {'Yes' if detailed_info['is_system_disk'] else 'No'}")
-                print(f"Hidden Areas: {detailed_info['hidden_capacity']}")
+                lines.append(f"Device: {detailed_info['device']}")
+                lines.append(f"Size: {detailed_info['size']} ({detailed_info['size_bytes']:,} bytes)")
+                lines.append(f"Type: {detailed_info['type_icon']} {detailed_info['type']}")
+                lines.append(f"Model: {detailed_info['model']}")
+                lines.append(f"Serial: {detailed_info['serial']}")
+                lines.append(f"Mountpoint: {detailed_info['mountpoint']}")
+                lines.append(f"Filesystem: {detailed_info['filesystem']}")
+                lines.append(f"Writable: {'Yes' if detailed_info['is_writable'] else 'No'}")
+                lines.append(f"System Disk: {'Yes' if detailed_info['is_system_disk'] else 'No'}")
+                lines.append(f"Hidden Areas: {detailed_info['hidden_capacity']}")
                 
                 # Show HPA/DCO details if available
                 if detailed_info.get('hpa_detected') or detailed_info.get('dco_detected'):
-                    print(f"\n🔍 Hidden Areas Details:")
-                    print(f"  HPA Detected: {'Yes' if detailed_info.get('hpa_detected') else 'No'}")
-                    print(f"  DCO Detected: {'Yes' if detailed_info.get('dco_detected') else 'No'}")
+                    lines.append(f"\n🔍 Hidden Areas Details:")
+                    lines.append(f"  HPA Detected: {'Yes' if detailed_info.get('hpa_detected') else 'No'}")
+                    lines.append(f"  DCO Detected: {'Yes' if detailed_info.get('dco_detected') else 'No'}")
                     if detailed_info.get('hpa_detected'):
-                        print(f"  HPA Capacity: {detailed_info.get('hpa_capacity', 'Unknown')}")
+                        lines.append(f"  HPA Capacity: {detailed_info.get('hpa_capacity', 'Unknown')}")
                     if detailed_info.get('dco_detected'):
-                        print(f"  DCO Capacity: {detailed_info.get('dco_capacity', 'Unknown')}")
-                    print(f"  Can Remove HPA: {'Yes' if detailed_info.get('can_remove_hpa') else 'No'}")
-                    print(f"  Can Remove DCO: {'Yes' if detailed_info.get('can_remove_dco') else 'No'}")
+                        lines.append(f"  DCO Capacity: {detailed_info.get('dco_capacity', 'Unknown')}")
+                    lines.append(f"  Can Remove HPA: {'Yes' if detailed_info.get('can_remove_hpa') else 'No'}")
+                    lines.append(f"  Can Remove DCO: {'Yes' if detailed_info.get('can_remove_dco') else 'No'}")
                 
                 # Show health information if available
                 if detailed_info.get('health_status'):
-                    print(f"\n💊 Health Information:")
-                    print(f"  Status: {detailed_info['health_status'].title()}")
+                    lines.append(f"\n💊 Health Information:")
+                    lines.append(f"  Status: {detailed_info['health_status'].title()}")
                     if detailed_info.get('temperature'):
-                        print(f"  Temperature: {detailed_info['temperature']}°C")
+                        lines.append(f"  Temperature: {detailed_info['temperature']}°C")
                     if detailed_info.get('power_on_hours'):
-                        print(f"  Power On Hours: {detailed_info['power_on_hours']:,}")
+                        lines.append(f"  Power On Hours: {detailed_info['power_on_hours']:,}")
                     if detailed_info.get('bad_sectors'):
-                        print(f"  Bad Sectors: {detailed_info['bad_sectors']}")
+                        lines.append(f"  Bad Sectors: {detailed_info['bad_sectors']}")
             else:
                 # Fallback to basic information
-                print(f"Device: {disk_info.device}")
-                print(f"Size: {disk_info.size // (1024**3)}GB ({disk_info.size:,} bytes)")
+                lines.append(f"Device: {disk_info.device}")
+                lines.append(f"Size: {disk_info.size // (1024**3)}GB ({disk_info.size:,} bytes)")
                 # Handle both enum and string types
                 if hasattr(disk_info.type, 'value'):
-                    print(f"Type: {disk_info.type.value.upper()}")
+                    lines.append(f"Type: {disk_info.type.value.upper()}")
                 else:
-                    print(f"Type: {disk_info.type.upper()}")
-                print(f"Model: {disk_info.model}")
-                print(f"Serial: {disk_info.serial}")
+                    lines.append(f"Type: {disk_info.type.upper()}")
+                lines.append(f"Model: {disk_info.model}")
+                lines.append(f"Serial: {disk_info.serial}")
                 
                 if disk_info.mountpoint:
-                    print(f"Mountpoint: {disk_info.mountpoint}")
+                    lines.append(f"Mountpoint: {disk_info.mountpoint}")
                 if disk_info.filesystem:
-                    print(f"Filesystem: {disk_info.filesystem}")
+                    lines.append(f"Filesystem: {disk_info.filesystem}")
                 
                 is_writable = self.disk_manager.is_disk_writable(device)
-                print(f"Writable: {'Yes' if is_writable else 'No'}")
+                lines.append(f"Writable: {'Yes' if is_writable else 'No'}")
             
-            print("=" * 60)
+            lines.append("=" * 60)
             
         except Exception as e:
-            print(f"❌ Error getting disk info: {e}")
+            lines.append(f"❌ Error getting disk info: {e}")
+        finally:
+            _write_lines(lines)
     
     def _show_intelligent_analysis(self, device: str):
         """Show comprehensive intelligent disk analysis"""
-        print(f"🧠 Intelligent Analysis for {device}")
-        print("=" * 60)
+        lines = [f"🧠 Intelligent Analysis for {device}", "=" * 60]
         
         try:
             # Get intelligent analysis
             analysis = self.disk_manager.get_intelligent_disk_analysis(device)
             if not analysis:
-                print("❌ Failed to analyze disk")
+                lines.append("❌ Failed to analyze disk")
+                _write_lines(lines)
                 return
             
             # Basic information
-            print(f"Device: {analysis.device}")
-            print(f"Role: {analysis.role.value.replace('_', ' ').title()}")
-            print(f"Interface: {analysis.interface.value.upper()}")
-            print(f"Safety Level: {analysis.safety_level.value.replace('_', ' ').title()}")
-            print(f"Confidence Score: {analysis.confidence_score:.1%}")
-            print()
+            lines.append(f"Device: {analysis.device}")
+            lines.append(f"Role: {analysis.role.value.replace('_', ' ').title()}")
+            lines.append(f"Interface: {analysis.interface.value.upper()}")
+            lines.append(f"Safety Level: {analysis.safety_level.value.replace('_', ' ').title()}")
+            lines.append(f"Confidence Score: {analysis.confidence_score:.1%}")
+            lines.append("")
             
             # Status information
-            print("📊 Status Information:")
-            print(f"  Readable: {'✅ Yes' if analysis.is_readable else '❌ No'}")
-            print(f"  Writable: {'✅ Yes' if analysis.is_writable else '❌ No'}")
-            print(f"  Mounted: {'✅ Yes' if analysis.is_mounted else '❌ No'}")
-            print(f"  System Disk: {'✅ Yes' if analysis.is_system_disk else '❌ No'}")
-            print(f"  Boot Disk: {'✅ Yes' if analysis.is_boot_disk else '❌ No'}")
-            print(f"  Removable: {'✅ Yes' if analysis.is_removable else '❌ No'}")
-            print(f"  External: {'✅ Yes' if analysis.is_external else '❌ No'}")
-            print(f"  Boot Priority: {analysis.boot_priority}")
-            print()
+            lines.append("📊 Status Information:")
+            lines.append(f"  Readable: {'✅ Yes' if analysis.is_readable else '❌ No'}")
+            lines.append(f"  Writable: {'✅ Yes' if analysis.is_writable else '❌ No'}")
+            lines.append(f"  Mounted: {'✅ Yes' if analysis.is_mounted else '❌ No'}")
+            lines.append(f"  System Disk: {'✅ Yes' if analysis.is_system_disk else '❌ No'}")
+            lines.append(f"  Boot Disk: {'✅ Yes' if analysis.is_boot_disk else '❌ No'}")
+            lines.append(f"  Removable: {'✅ Yes' if analysis.is_removable else '❌ No'}")
+            lines.append(f"  External: {'✅ Yes' if analysis.is_external else '❌ No'}")
+            lines.append(f"  Boot Priority: {analysis.boot_priority}")
+            lines.append("")
             
             # Partition information
             if analysis.partitions:
-                print("💾 Partitions:")
+                lines.append("💾 Partitions:")
                 for i, partition in enumerate(analysis.partitions, 1):
                     mount_point = analysis.mount_points[i-1] if i-1 < len(analysis.mount_points) else "Not mounted"
                     filesystem = analysis.filesystems[i-1] if i-1 < len(analysis.filesystems) else "Unknown"
-                    print(f"  {i}. {partition} -> {mount_point} ({filesystem})")
-                print()
+                    lines.append(f"  {i}. {partition} -> {mount_point} ({filesystem})")
+                lines.append("")
             
             # Warnings
             if analysis.warnings:
-                print("⚠️ Warnings:")
+                lines.append("⚠️ Warnings:")
                 for warning in analysis.warnings:
-                    print(f"  • {warning}")
-                print()
+                    lines.append(f"  • {warning}")
+                lines.append("")
             
             # Recommendations
             if analysis.recommendations:
-                print("💡 Recommendations:")
+                lines.append("💡 Recommendations:")
                 for rec in analysis.recommendations:
-                    print(f"  • {rec}")
-                print()
+                    lines.append(f"  • {rec}")
+                lines.append("")
             
             # Metadata
             if analysis.metadata:
-                print("🔍 Technical Details:")
+                lines.append("🔍 Technical Details:")
                 for key, value in analysis.metadata.items():
-                    print(f"  {key.replace('_', ' ').title()}: {value}")
-                print()
+                    lines.append(f"  {key.replace('_', ' ').title()}: {value}")
+                lines.append("")
             
             # Safety assessment
-            print("🛡️ Safety Assessment:")
+            lines.append("🛡️ Safety Assessment:")
             if analysis.safety_level.value == 'safe':
-                print("  ✅ This disk appears safe to wipe")
+                lines.append("  ✅ This disk appears safe to wipe")
             elif analysis.safety_level.value == 'warning_required':
-                print("  ⚠️ This disk requires careful consideration before wiping")
+                lines.append("  ⚠️ This disk requires careful consideration before wiping")
             elif analysis.safety_level.value == 'dangerous':
-                print("  🚨 This disk is dangerous to wipe - may damage system")
+                lines.append("  🚨 This disk is dangerous to wipe - may damage system")
             elif analysis.safety_level.value == 'critical':
-                print("  🚨 CRITICAL: This disk is essential for system operation")
+                lines.append("  🚨 CRITICAL: This disk is essential for system operation")
             else:
-                print("  ❓ Safety level unknown - use extreme caution")
+                lines.append("  ❓ Safety level unknown - use extreme caution")
             
         except Exception as e:
-            print(f"❌ Error analyzing disk: {e}")
+            lines.append(f"❌ Error analyzing disk: {e}")
         
-        print("\n" + "=" * 60)
+        lines.append("\n" + "=" * 60)
+        _write_lines(lines)
     
-    def _wipe_disk(self, device: str, method: str, passes: int, verify: bool, force: bool):
-        """Wipe a disk with enhanced information display"""
-        print(f"🚀 Disk Wipe Operation")
-        print("=" * 50)
-        print(f"Device: {device}")
-        print(f"Method: {method}")
-        print(f"Passes: {passes}")
-        print(f"Verify: {'Yes' if verify else 'No'}")
-        print(f"Force: {'Yes' if force else 'No'}")
-        print("-" * 50)
+    def _wipe_disks(self, devices: List[str], method: str, passes: int, verify: bool,
+                    force: bool, max_parallel: Optional[int] = None,
+                    assume_encrypted_ok: bool = False):
+        """Wipe one or more disks, running the wipes of several disks in parallel"""
+        # A device named twice must not be wiped by two workers at once
+        devices = list(dict.fromkeys(devices))
+        if len(devices) == 1:
+            self._wipe_disk(devices[0], method, passes, verify, force, assume_encrypted_ok)
+            return
+        
+        # Checks and confirmations run one device at a time before anything is wiped
+        methods = {}
+        for device in devices:
+            confirmed = self._confirm_wipe_target(device, method, passes, verify, force,
+                                                  assume_encrypted_ok)
+            if confirmed:
+                methods[device] = confirmed
+        targets = list(methods)
+        if not targets:
+            return
+        
+        # Each disk is an independent I/O endpoint; cap the fan-out on request
+        # so a single controller is not saturated
+        workers = max(1, min(max_parallel or len(targets), len(targets)))
+        print(f"\n🔄 Wiping {len(targets)} disks, {workers} at a time...")
+        
+        # Any password prompt happens here, before the workers start; a prompt
+        # from inside a worker would have its explanation buffered away
+        if not self.disk_manager.sudo_manager.ensure_privileges():
+            print("❌ Administrator privileges are required to wipe several disks at once. "
+                  "Run with sudo or configure passwordless sudo.")
+            sys.exit(1)
+        
+        # Progress lines of concurrent wipes would interleave; each worker's
+        # output is buffered and printed as one block when its disk is done
+        def wipe_one(device: str):
+            with output.capture() as buffer:
+                try:
+                    result = self.disk_manager.wipe_disk_with_sudo(device, methods[device], passes, verify)
+                except Exception as e:
+                    result = False, str(e)
+                return result, buffer.getvalue()
         
-        # Check if device exists
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        results = {}
         try:
-            disk_info = self.disk_manager.get_disk_info(device)
-            if not disk_info:
-                print(f"Error: Device {device} not found")
-                return
+            with _per_thread_stdout() as output, ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(wipe_one, device): device for device in targets}
+                for future in as_completed(futures):
+                    device = futures[future]
+                    (success, message), captured = future.result()
+                    results[device] = (success, message)
+                    _write_lines([f"\n--- {device} ---", captured.rstrip("\n"),
+                                  f"{'✅' if success else '❌'} {device}: {message}"])
+        except KeyboardInterrupt:
+            print("\n⚠️ Operation cancelled by user")
+            sys.exit(1)
+        
+        lines = ["\n" + "=" * 50]
+        for device in targets:
+            success, message = results[device]
+            lines.append(f"{'✅' if success else '❌'} {device}: {message}")
+        failed = sum(1 for success, _ in results.values() if not success)
+        lines.append(f"{len(results) - failed}/{len(results)} disk wipes completed successfully")
+        lines.append("=" * 50)
+        _write_lines(lines)
+        if failed:
+            sys.exit(1)
+    
+    def _confirm_wipe_target(self, device: str, method: str, passes: int, verify: bool,
+                             force: bool, assume_encrypted_ok: bool = False) -> Optional[str]:
+        """Run the safety checks, show the wipe plan and confirm; return the method to use or None"""
+        # Check the device exists, is writable and is not a system disk
+        try:
+            _, reason = self.disk_manager.validate_wipe_target(device)
         except Exception as e:
             print(f"Error: {e}")
-            return
+            return None
         
-        # Check if writable
-        if not self.disk_manager.is_disk_writable(device):
+        if reason == 'not_found':
+            print(f"Error: Device {device} not found")
+            return None
+        
+        if reason == 'read_only':
             print(f"Error: Device {device} is not writable")
-            return
+            return None
         
         # Enhanced safety check - prevent wiping system disks
-        system_disks = self.disk_manager.get_system_disks()
-        if device in system_disks:
-            print(f"\n🚨 CRITICAL ERROR: SYSTEM DISK PROTECTION 🚨")
-            print(f"The selected disk {device} is a SYSTEM DISK!")
-            print(f"Wiping this disk would DESTROY YOUR OPERATING SYSTEM!")
-            print(f"This operation is BLOCKED for your safety.")
-            print(f"Please select a different disk.")
-            return
+        if reason == 'system_disk':
+            _write_lines([
+                "\n🚨 CRITICAL ERROR: SYSTEM DISK PROTECTION 🚨",
+                f"The selected disk {device} is a SYSTEM DISK!",
+                "Wiping this disk would DESTROY YOUR OPERATING SYSTEM!",
+                "This operation is BLOCKED for your safety.",
+                "Please select a different disk.",
+            ])
+            return None
+        
+        # Only a target that passed the checks is probed, which may need sudo
+        requested = method
+        method = self._resolve_wipe_method(device, method, assume_encrypted_ok)
+        shown = self.disk_manager.effective_wipe_method(device, method)
+        _write_lines([
+            "🚀 Disk Wipe Operation",
+            "=" * 50,
+            f"Device: {device}",
+            f"Method: {shown}" + (f" (requested: {requested})" if shown != requested else ""),
+            f"Passes: {passes}",
+            f"Verify: {'Yes' if verify else 'No'}",
+            f"Force: {'Yes' if force else 'No'}",
+            "-" * 50,
+        ])
         
         # Confirmation
-        if not force:
-            print(f"\nWARNING: This will permanently erase all data on {device}")
-            response = input("Are you sure you want to continue? (yes/no): ")
-            if response.lower() != 'yes':
-                print("Operation cancelled")
-                return
+        if not force and not _confirm(f"\nWARNING: This will permanently erase all data on {device} "
+                                      f"using {shown}\n"
+                                      "Are you sure you want to continue? (yes/no): "):
+            print("Operation cancelled")
+            return None
+        
+        return method
+    
+    def _resolve_wipe_method(self, device: str, method: str, assume_encrypted_ok: bool) -> str:
+        """Swap an overwrite for a LUKS header erase when allowed and the device is encrypted"""
+        if not assume_encrypted_ok or method not in _OVERWRITE_METHODS:
+            return method
+        header = self.disk_manager.probe_header(device)
+        if header == 'unknown':
+            print(f"⚠️ {device}: could not read the device header - "
+                  f"cannot tell whether it is encrypted, keeping {method}")
+        if header != 'luks':
+            return method
+        print(f"🔐 {device}: existing LUKS header - performing cryptographic erase instead of {method}")
+        return 'luks-erase'
+    
+    def _wipe_disk(self, device: str, method: str, passes: int, verify: bool, force: bool,
+                   assume_encrypted_ok: bool = False):
+        """Wipe a disk with enhanced information display"""
+        method = self._confirm_wipe_target(device, method, passes, verify, force, assume_encrypted_ok)
+        if not method:
+            return
         
         # Perform wipe with automatic sudo handling
         print(f"\n🔄 Starting wipe operation with automatic sudo handling...")
@@ -692,15 +1075,10 @@ Examples:
             # Use the new sudo-enabled wipe method
             success, message = self.disk_manager.wipe_disk_with_sudo(device, method, passes, verify)
             
-            print("\n" + "=" * 50)
-            if success:
-                print(f"✅ SUCCESS: {message}")
-                print("🎉 Disk wipe completed successfully!")
-            else:
-                print(f"❌ ERROR: {message}")
-                print("💥 Disk wipe failed!")
+            header, tail = _RESULT_BANNERS[bool(success)]
+            _write_lines(["\n" + "=" * 50, f"{header}: {message}", tail, "=" * 50])
+            if not success:
                 sys.exit(1)
-            print("=" * 50)
                 
         except KeyboardInterrupt:
             print("\n⚠️ Operation cancelled by user")
@@ -711,55 +1089,47 @@ Examples:
     
     def _show_wipe_methods(self):
         """Show available wipe methods with enhanced descriptions"""
-        print("🔧 Available Wipe Methods:")
-        print("=" * 60)
+        lines = ["🔧 Available Wipe Methods:", "=" * 60]
         
         try:
             methods = self.disk_manager.get_wipe_methods()
             
             for i, method in enumerate(methods, 1):
                 description = self._get_method_description(method)
-                print(f"{i:2d}. {method:<15} - {description}")
+                lines.append(f"{i:2d}. {method:<15} - {description}")
             
-            print("=" * 60)
-            print(f"Total: {len(methods)} methods available")
+            lines.append("=" * 60)
+            lines.append(f"Total: {len(methods)} methods available")
                 
         except Exception as e:
-            print(f"❌ Error getting wipe methods: {e}")
+            lines.append(f"❌ Error getting wipe methods: {e}")
+        finally:
+            _write_lines(lines)
     
     def _get_method_description(self, method: str) -> str:
         """Get enhanced description for a wipe method"""
-        descriptions = {
-            'secure': 'Multi-pass secure wipe (recommended for sensitive data)',
-            'quick': 'Single-pass quick wipe (faster, less secure)',
-            'dd': 'DD-based wiping with random data (very secure)',
-            'cipher': 'Windows Cipher.exe free space wipe (Windows only)',
-            'hdparm': 'Linux hdparm secure erase (hardware-level, HDDs)',
-            'nvme': 'NVMe secure format (SSD-specific, very fast)',
-            'blkdiscard': 'TRIM-based discard (SSD-optimized, fast)',
-            'saf': 'Android Storage Access Framework (Android only)'
-        }
-        
-        return descriptions.get(method, 'Custom wipe method')
+        return _METHOD_DESCRIPTIONS.get(method, 'Custom wipe method')
     
     def _generate_certificate(self, device: str, method: str, passes: int, 
                             success: bool, bytes_written: int):
         """Generate NIST-compliant certificate for a wipe operation"""
         try:
-            print(f"\n🎓 Generating NIST-Compliant Certificate")
-            print("=" * 50)
-            print(f"Device: {device}")
-            print(f"Method: {method}")
-            print(f"Passes: {passes}")
-            print(f"Success: {success}")
-            print(f"Bytes Written: {bytes_written:,}")
+            _write_lines([
+                "\n🎓 Generating NIST-Compliant Certificate",
+                "=" * 50,
+                f"Device: {device}",
+                f"Method: {method}",
+                f"Passes: {passes}",
+                f"Success: {success}",
+                f"Bytes Written: {_humanize(bytes_written)} ({bytes_written:,} bytes)",
+                "\n📋 Generating certificate...",
+            ])
+            
+            from ..core.certificate_generator import generate_wipe_certificate
             
             # Generate timestamps (simulate recent operation)
-            from datetime import timedelta
             end_time = datetime.now()
-            start_time = end_time - timedelta(seconds=30)  # 30 seconds ago
-            
-            print(f"\n📋 Generating certificate...")
+            start_time = end_time - _CERTIFICATE_WINDOW
             
             # Generate certificates
             certificates = generate_wipe_certificate(
@@ -777,20 +1147,12 @@ Examples:
                 }
             )
             
-            print(f"\n✅ Certificates Generated Successfully!")
-            print("=" * 50)
+            lines = ["\n✅ Certificates Generated Successfully!", "=" * 50]
             for cert_type, path in certificates.items():
-                print(f"📄 {cert_type.upper()}: {path}")
-            
-            print(f"\n📋 Certificate Details:")
-            print(f"  • NIST SP 800-88 Rev. 1 Compliant")
-            print(f"  • Unique Certificate ID generated")
-            print(f"  • Complete device information captured")
-            print(f"  • Sanitization details documented")
-            print(f"  • Verification results included")
-            print(f"  • Digital signature and checksum")
+                lines.append(f"📄 {cert_type.upper()}: {path}")
             
-            print(f"\n🎉 Certificate generation complete!")
+            lines.append(_CERTIFICATE_DETAILS)
+            _write_lines(lines)
             
         except Exception as e:
             print(f"❌ Error generating certificate: {e}")
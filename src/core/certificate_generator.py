@@ -32,6 +32,28 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+if HAS_REPORTLAB:
+    # Layout of the four-column label/value tables in the PDF certificate;
+    # built once, as Table only reads its style
+    _FIELD_COL_WIDTHS = (1.5*inch, 2*inch, 1.5*inch, 2*inch)
+    _FIELD_TABLE_STYLE = TableStyle([
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
+    ])
+    
+    # Layout of the signature block
+    _SIGNATURE_COL_WIDTHS = (1*inch, 2.5*inch, 0.8*inch, 2.2*inch)
+    _SIGNATURE_TABLE_STYLE = TableStyle([
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
+    ])
+
+
 class SanitizationType(Enum):
     """NIST-defined sanitization types"""
     CLEAR = "Clear"
@@ -271,6 +293,9 @@ class WipeOperationData:
 class RealTimeCertificateGenerator:
     """Generate certificates with real disk wipeout data"""
     
+    # PDF stylesheet shared by all generators; it is never modified after setup
+    _shared_styles = None
+    
     def __init__(self, output_dir: str = "certificates"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
@@ -280,8 +305,11 @@ class RealTimeCertificateGenerator:
         self.pdf_dir.mkdir(exist_ok=True)
         
         if HAS_REPORTLAB:
-            self.styles = getSampleStyleSheet()
-            self._setup_pdf_styles()
+            if RealTimeCertificateGenerator._shared_styles is None:
+                self.styles = getSampleStyleSheet()
+                self._setup_pdf_styles()
+                RealTimeCertificateGenerator._shared_styles = self.styles
+            self.styles = RealTimeCertificateGenerator._shared_styles
     
     def _setup_pdf_styles(self):
         """Setup PDF styles"""
@@ -495,14 +523,8 @@ class RealTimeCertificateGenerator:
             ["Serial Number:", operation_data.device_serial, "Capacity:", operation_data.device_size_formatted],
             ["Interface:", operation_data.device_interface, "SMART Status:", operation_data.smart_status]
         ]
-        device_table = Table(device_data, colWidths=[1.5*inch, 2*inch, 1.5*inch, 2*inch])
-        device_table.setStyle(TableStyle([
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-        ]))
+        device_table = Table(device_data, colWidths=list(_FIELD_COL_WIDTHS))
+        device_table.setStyle(_FIELD_TABLE_STYLE)
         story.append(device_table)
         story.append(Spacer(1, 0.2*inch))
         
@@ -518,14 +540,8 @@ class RealTimeCertificateGenerator:
             ["Status:", "SUCCESS" if operation_data.operation_success else "FAILED", 
              "Verification:", operation_data.verification_status]
         ]
-        sanitize_table = Table(sanitize_data, colWidths=[1.5*inch, 2*inch, 1.5*inch, 2*inch])
-        sanitize_table.setStyle(TableStyle([
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-        ]))
+        sanitize_table = Table(sanitize_data, colWidths=list(_FIELD_COL_WIDTHS))
+        sanitize_table.setStyle(_FIELD_TABLE_STYLE)
         story.append(sanitize_table)
         story.append(Spacer(1, 0.2*inch))
         
@@ -538,14 +554,8 @@ class RealTimeCertificateGenerator:
             ["Tool Version:", operation_data.system_info['tool_version'],
              "Checksum:", operation_data.data_checksum[:16] + "..."]
         ]
-        system_table = Table(system_data, colWidths=[1.5*inch, 2*inch, 1.5*inch, 2*inch])
-        system_table.setStyle(TableStyle([
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-        ]))
+        system_table = Table(system_data, colWidths=list(_FIELD_COL_WIDTHS))
+        system_table.setStyle(_FIELD_TABLE_STYLE)
         story.append(system_table)
         story.append(Spacer(1, 0.3*inch))
         
@@ -572,13 +582,8 @@ class RealTimeCertificateGenerator:
             ["Signature:", "_" * 40, "Date:", "_" * 20],
             ["Name:", "_" * 40, "Title:", "_" * 20]
         ]
-        sig_table = Table(sig_data, colWidths=[1*inch, 2.5*inch, 0.8*inch, 2.2*inch])
-        sig_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-        ]))
+        sig_table = Table(sig_data, colWidths=list(_SIGNATURE_COL_WIDTHS))
+        sig_table.setStyle(_SIGNATURE_TABLE_STYLE)
         story.append(sig_table)
         
         # Build PDF
@@ -590,9 +595,11 @@ class RealTimeCertificateGenerator:
     def _map_to_sanitization_type(self, method: str) -> str:
         """Map wipe method to NIST sanitization type"""
         method_lower = method.lower()
-        if method_lower in ['quick', 'dd', 'secure']:
+        # A discard only asks the device to drop blocks and does not guarantee
+        # the old data is unreadable, so it certifies as Clear
+        if method_lower in ['quick', 'dd', 'secure', 'blkdiscard']:
             return "Clear"
-        elif method_lower in ['hdparm', 'nvme', 'blkdiscard']:
+        elif method_lower in ['hdparm', 'nvme', 'luks-erase']:
             return "Purge"
         else:
             return "Clear"
@@ -608,6 +615,8 @@ class RealTimeCertificateGenerator:
             return "NVMe Format"
         elif method_lower == 'blkdiscard':
             return "TRIM/UNMAP"
+        elif method_lower == 'luks-erase':
+            return "Cryptographic Erase"
         else:
             return "Overwrite"
     
@@ -10,8 +10,9 @@ import psutil
 import json
 import fnmatch
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import Any, Callable, List, Dict, FrozenSet, Optional, Tuple
 from abc import ABC, abstractmethod
 from pathlib import Path
 
@@ -22,10 +23,19 @@ from .platforms.android_disk_handler import AndroidDiskHandler
 from .verification import VerificationManager
 from .intelligent_disk_analyzer import IntelligentDiskAnalyzer, DiskRole, DiskInterface, DiskSafetyLevel
 from .sudo_manager import SudoManager
-from .certificate_generator import generate_wipe_certificate
 
 logger = logging.getLogger(__name__)
 
+# Seconds a get_disk_info result is reused; long enough for the checks of one
+# command to share a probe, short enough that the data never goes stale
+DISK_INFO_TTL = 1.0
+
+# Magic bytes at offset 0 of a LUKS1/LUKS2 header
+LUKS_MAGIC = b"LUKS\xba\xbe"
+
+# Upper bound on threads used to probe several disks at once
+PROBE_WORKERS = 8
+
 class DiskManager:
     """Main disk management class"""
     
@@ -36,6 +46,9 @@ class DiskManager:
         self.safety_config = self._load_safety_config()
         self.intelligent_analyzer = IntelligentDiskAnalyzer()
         self.sudo_manager = SudoManager()
+        self._system_disks: Optional[FrozenSet[str]] = None
+        self._wipe_methods: Optional[Tuple[str, ...]] = None
+        self._disk_info_cache: Dict[str, Tuple[float, Optional[DiskInfo]]] = {}
         
     def _get_platform_handler(self):
         """Get the appropriate platform handler"""
@@ -58,11 +71,20 @@ class DiskManager:
     
     def get_disk_info(self, device: str) -> Optional[DiskInfo]:
         """Get detailed information about a specific disk"""
+        # On Linux every lookup also runs the hdparm/smartctl HPA/DCO probes;
+        # back-to-back checks of the same device share one result
+        now = time.monotonic()
+        cached = self._disk_info_cache.get(device)
+        if cached and now - cached[0] < DISK_INFO_TTL:
+            return cached[1]
+        
         try:
-            return self.handler.get_disk_info(device)
+            disk_info = self.handler.get_disk_info(device)
         except Exception as e:
             logger.error(f"Error getting disk info for {device}: {e}")
             return None
+        self._disk_info_cache[device] = (now, disk_info)
+        return disk_info
     
     def get_intelligent_disk_analysis(self, device: str):
         """Get comprehensive intelligent disk analysis"""
@@ -88,12 +110,17 @@ class DiskManager:
         Returns:
             Tuple of (success, message)
         """
+        # Imported here so commands that never wipe do not load reportlab
+        from .certificate_generator import generate_wipe_certificate
+        
         start_time = datetime.now()
         bytes_written = 0
         verification_result = None
         
         try:
-            # CRITICAL SAFETY CHECK - Block protected devices
+            # CRITICAL SAFETY CHECK - Block protected devices, against the
+            # current mounts rather than those seen when the cache was filled
+            self.refresh_system_disks()
             if self.is_device_protected(device):
                 error_msg = f"CRITICAL SAFETY ERROR: Device {device} is PROTECTED and cannot be wiped!"
                 logger.error(error_msg)
@@ -173,14 +200,35 @@ class DiskManager:
             
             logger.info(f"Starting sudo-enabled wipe of {device} using {method} method with {passes} passes")
             
-            # Use sudo manager for seamless wiping
-            success, message = self.sudo_manager.wipe_disk_with_sudo(device, method, passes)
+            # Use sudo manager for seamless wiping. A quick wipe of an SSD runs
+            # as a full discard; the certificate records what actually ran
+            requested_method = method
+            method = self.effective_wipe_method(device, method)
+            
+            # A LUKS erase overwrites only the header area; its size is read
+            # once, before the erase destroys it, and used by both the erase
+            # and the certificate
+            luks_header_bytes = None
+            if method == "luks-erase":
+                luks_header_bytes = self.sudo_manager.luks_data_offset(device)
+            
+            success, message = self.sudo_manager.wipe_disk_with_sudo(device, method, passes,
+                                                                     luks_header_bytes)
+            if not success and method != requested_method:
+                logger.warning(f"{method} failed ({message}); falling back to {requested_method}")
+                method = requested_method
+                success, message = self.sudo_manager.wipe_disk_with_sudo(device, method, passes)
             
             end_time = datetime.now()
             
-            # Estimate bytes written based on device size
+            # Estimate bytes written based on device size; a discard writes no
+            # data and a LUKS erase only overwrites the header area
             if success and disk_info:
                 bytes_written = disk_info.size
+                if method == "blkdiscard":
+                    bytes_written = 0
+                elif method == "luks-erase":
+                    bytes_written = min(bytes_written, luks_header_bytes or 0)
             
             # Perform verification if requested
             if success and verify:
@@ -262,7 +310,9 @@ class DiskManager:
             Tuple of (success, message)
         """
         try:
-            # CRITICAL SAFETY CHECK - Block protected devices
+            # CRITICAL SAFETY CHECK - Block protected devices, against the
+            # current mounts rather than those seen when the cache was filled
+            self.refresh_system_disks()
             if self.is_device_protected(device):
                 error_msg = f"CRITICAL SAFETY ERROR: Device {device} is PROTECTED and cannot be wiped!"
                 logger.error(error_msg)
@@ -334,7 +384,10 @@ class DiskManager:
     
     def get_wipe_methods(self) -> List[str]:
         """Get available wiping methods for current platform"""
-        return self.handler.get_wipe_methods()
+        # Tool probing spawns 'which' for every missing tool; resolve it once
+        if self._wipe_methods is None:
+            self._wipe_methods = tuple(self.handler.get_wipe_methods())
+        return list(self._wipe_methods)
 
     def auto_detect_best_wipe_method(self, device: str) -> Tuple[str, str]:
         """
@@ -408,6 +461,82 @@ class DiskManager:
         # Then check platform-specific writability
         return self.handler.is_disk_writable(device)
     
+    def validate_wipe_target(self, device: str) -> Tuple[bool, str]:
+        """
+        Check that a device exists, is writable and is not a system disk
+
+        Fuses the existence, protection and writability checks so the disk
+        info is looked up once instead of once per check.
+
+        Returns:
+            Tuple of (is_valid, reason) where reason is 'ok', 'not_found',
+            'read_only' or 'system_disk'
+        """
+        disk_info = self.get_disk_info(device)
+        if not disk_info:
+            return False, 'not_found'
+        
+        is_system_disk = self._is_system_disk(device)
+        removable = disk_info.is_removable or disk_info.type == DiskType.REMOVABLE
+        if (is_system_disk and not removable) or not self.handler.is_disk_writable(device):
+            return False, 'read_only'
+        
+        if is_system_disk:
+            return False, 'system_disk'
+        
+        return True, 'ok'
+    
+    def effective_wipe_method(self, device: str, method: str) -> str:
+        """Return the technique wipe_disk_with_sudo will actually run for a method on a device"""
+        # Removable devices take the USB quick wipe path, which never discards
+        disk_info = self.get_disk_info(device)
+        if disk_info and disk_info.is_removable:
+            return method
+        return self.sudo_manager.effective_method(device, method)
+    
+    def probe_header(self, device: str) -> str:
+        """
+        Identify what the start of a device holds
+
+        Returns:
+            'luks' if the device carries a LUKS header, 'data' if it does not,
+            or 'unknown' if the device cannot be read even with sudo
+        """
+        try:
+            with open(device, 'rb') as f:
+                magic = f.read(len(LUKS_MAGIC))
+        except PermissionError:
+            # Block devices are normally readable by root only
+            magic = self.sudo_manager.read_device_bytes(device, len(LUKS_MAGIC))
+            if magic is None:
+                return 'unknown'
+        except OSError:
+            return 'unknown'
+        return 'luks' if magic == LUKS_MAGIC else 'data'
+    
+    def _probe_batch(self, probe: Callable[[str], Any], devices: List[str]) -> Dict[str, Any]:
+        """
+        Run a per-device probe over several disks
+
+        The probes block on subprocesses, sysfs reads and the device nodes,
+        so they are overlapped on a small thread pool instead of running serially.
+
+        Returns:
+            Dict mapping each device path to its probe result
+        """
+        if not devices:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(devices))) as executor:
+            return dict(zip(devices, executor.map(probe, devices)))
+    
+    def is_disk_writable_batch(self, devices: List[str]) -> Dict[str, bool]:
+        """Check writability of several disks at once, keyed by device path"""
+        return self._probe_batch(self.is_disk_writable, devices)
+    
+    def get_disk_status_batch(self, devices: List[str]) -> Dict[str, Dict[str, any]]:
+        """Get get_disk_status_safe() for several disks at once, keyed by device path"""
+        return self._probe_batch(self.get_disk_status_safe, devices)
+    
     def get_disk_status_safe(self, device: str) -> Dict[str, any]:
         """Get intelligent disk status information using advanced analysis"""
         try:
@@ -564,8 +693,19 @@ class DiskManager:
                 result[key] = value
         return result
     
-    def get_system_disks(self) -> List[str]:
-        """Get list of system disks that should not be wiped"""
+    @property
+    def system_disks(self) -> FrozenSet[str]:
+        """System disks that should not be wiped, resolved once until refresh_system_disks()"""
+        if self._system_disks is None:
+            self._system_disks = self._find_system_disks()
+        return self._system_disks
+    
+    def refresh_system_disks(self):
+        """Forget the resolved system disks so the next check rescans mounts and disks"""
+        self._system_disks = None
+    
+    def _find_system_disks(self) -> FrozenSet[str]:
+        """Collect system disks from the platform handler and safety config"""
         system_disks = self.handler.get_system_disks()
         
         # Add configured protected devices
@@ -581,7 +721,27 @@ class DiskManager:
                         if disk.device not in system_disks:
                             system_disks.append(disk.device)
         
-        return list(set(system_disks))  # Remove duplicates
+        return frozenset(system_disks)
+    
+    def get_system_disks(self) -> List[str]:
+        """Get list of system disks that should not be wiped"""
+        return list(self.system_disks)
+    
+    def _is_system_disk(self, device: str) -> bool:
+        """Check a device, or the whole disk it is a partition of, against the system disks"""
+        system_disks = self.system_disks
+        if device in system_disks:
+            return True
+        
+        # Resolve symlinks such as /dev/disk/by-id/* and map a partition to its
+        # parent disk through sysfs, so /dev/sda1 hits the /dev/sda entry
+        real_device = os.path.realpath(device)
+        name = os.path.basename(real_device)
+        sys_block = f"/sys/class/block/{name}"
+        if os.path.exists(f"{sys_block}/partition"):
+            parent = os.path.basename(os.path.dirname(os.path.realpath(sys_block)))
+            real_device = f"/dev/{parent}"
+        return real_device in system_disks
     
     def is_device_protected(self, device: str) -> bool:
         """Check if a device is protected from wiping"""
@@ -590,8 +750,7 @@ class DiskManager:
         if disk_info and (disk_info.is_removable or disk_info.type == DiskType.REMOVABLE):
             return False  # Never protect removable devices
         
-        system_disks = self.get_system_disks()
-        return device in system_disks
+        return self._is_system_disk(device)
     
     def validate_wipe_operation(self, device: str, method: str, passes: int, 
                               remove_hpa: bool = False, remove_dco: bool = False) -> Tuple[bool, List[str]]:
@@ -708,6 +867,7 @@ class DiskManager:
                 return False, f"Cannot remove HPA from protected device {device}"
 
             logger.warning(f"Attempting to remove HPA from {device}")
+            self._disk_info_cache.pop(device, None)
             return self.handler.remove_hpa(device)
         except AttributeError:
             return False, "HPA removal not implemented for this platform"
@@ -753,6 +913,7 @@ class DiskManager:
                              "This operation can PERMANENTLY DAMAGE the disk and should only be performed "
                              "by experienced professionals with proper backup procedures.")
 
+            self._disk_info_cache.pop(device, None)
             return self.handler.remove_dco(device)
         except AttributeError:
             return False, "DCO removal not implemented for this platform"
@@ -763,7 +924,8 @@ class DiskManager:
 
     def wipe_with_hpa_dco_removal(self, device: str, method: str = "secure",
                                   passes: int = 3, verify: bool = True,
-                                  remove_hpa: bool = False, remove_dco: bool = False) -> Tuple[bool, str]:
+                                  remove_hpa: bool = False, remove_dco: bool = False,
+                                  hpa_dco_info: Optional[Dict] = None) -> Tuple[bool, str]:
         """
         Wipe disk with optional HPA/DCO removal
 
@@ -774,14 +936,17 @@ class DiskManager:
             verify: Whether to verify the wipe
             remove_hpa: Whether to remove HPA before wiping
             remove_dco: Whether to remove DCO before wiping
+            hpa_dco_info: Result of a previous detect_hpa_dco() call for this
+                device; detection is run again when not given
 
         Returns:
             Tuple of (success, message)
         """
         messages = []
 
-        # Detect HPA/DCO
-        hpa_dco_info = self.detect_hpa_dco(device)
+        # Detect HPA/DCO unless the caller already did
+        if hpa_dco_info is None:
+            hpa_dco_info = self.detect_hpa_dco(device)
 
         if hpa_dco_info.get('hpa_detected'):
             hidden_gb = (hpa_dco_info.get('hpa_sectors', 0) * 512) // (1024**3)
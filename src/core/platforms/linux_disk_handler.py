@@ -344,25 +344,11 @@ class LinuxDiskHandler(BaseDiskHandler):
                 with open(serial_file, 'r') as f:
                     serial = f.read().strip()
 
-            # Check if device is removable
-            is_removable = False
-            removable_file = os.path.join(self.block_devices_path, device_name, "removable")
-            if os.path.exists(removable_file):
-                with open(removable_file, 'r') as f:
-                    is_removable = f.read().strip() == "1"
-
-            # Check if it's a USB device by examining device path
-            is_usb = False
-            try:
-                device_path_real = os.path.realpath(os.path.join(self.block_devices_path, device_name, "device"))
-                if 'usb' in device_path_real.lower():
-                    is_usb = True
-                    is_removable = True  # USB devices are removable
-            except:
-                pass
+            # Check if device is removable (USB devices count as removable)
+            is_removable = self._is_removable(device_name)
 
             # Determine disk type with USB detection
-            if is_usb or is_removable:
+            if is_removable:
                 disk_type = DiskType.REMOVABLE
             else:
                 disk_type = self._determine_disk_type(device_name, model)
@@ -441,6 +427,31 @@ class LinuxDiskHandler(BaseDiskHandler):
             logger.error(f"Error getting disk info for {device_name}: {e}")
             return None
 
+    def _is_removable(self, device_name: str) -> bool:
+        """Check the sysfs removable flag and whether the disk sits on a USB bus"""
+        removable_file = os.path.join(self.block_devices_path, device_name, "removable")
+        try:
+            with open(removable_file, 'r') as f:
+                if f.read().strip() == "1":
+                    return True
+        except OSError:
+            pass
+        
+        device_path_real = os.path.realpath(os.path.join(self.block_devices_path, device_name, "device"))
+        return 'usb' in device_path_real.lower()
+    
+    def _root_disk(self) -> str:
+        """Find the disk holding the root filesystem from its device number in sysfs"""
+        root_dev = os.stat('/').st_dev
+        sys_dev = os.path.realpath(f"/sys/dev/block/{os.major(root_dev)}:{os.minor(root_dev)}")
+        if not os.path.isdir(sys_dev):
+            return ""
+        
+        # A partition's sysfs directory sits inside its parent disk's directory
+        if os.path.exists(os.path.join(sys_dev, "partition")):
+            sys_dev = os.path.dirname(sys_dev)
+        return f"/dev/{os.path.basename(sys_dev)}"
+    
     def _is_system_disk(self, device: str) -> bool:
         """Check if a disk is a system disk"""
         try:
@@ -580,10 +591,15 @@ class LinuxDiskHandler(BaseDiskHandler):
             if not blkdiscard_path:
                 return False, "blkdiscard not available"
             
+            from ..sudo_manager import SudoManager, supports_discard
+            sudo_manager = SudoManager()
+            
+            # Fail before the privileged run on devices that cannot discard
+            if not supports_discard(device):
+                return False, f"Device {device} does not support discard (TRIM)"
+            
             # Perform TRIM discard
             cmd = [blkdiscard_path, device]
-            from ..sudo_manager import SudoManager
-            sudo_manager = SudoManager()
             success, stdout, stderr = sudo_manager.run_with_sudo(cmd, "blkdiscard TRIM")
             
             if success:
@@ -718,9 +734,9 @@ class LinuxDiskHandler(BaseDiskHandler):
             if device in system_disks:
                 return False
             
-            # Get disk info to check if it's removable
-            disk_info = self.get_disk_info(device)
-            is_removable = disk_info and disk_info.is_removable
+            # Check removability straight from sysfs; get_disk_info would also
+            # run the hdparm/smartctl HPA/DCO probes
+            is_removable = self._is_removable(os.path.basename(device))
             
             # For removable devices, allow wiping even if mounted (we'll unmount them)
             if is_removable:
@@ -748,19 +764,12 @@ class LinuxDiskHandler(BaseDiskHandler):
         system_disks = []
         
         try:
-            # Method 1: Get root filesystem from df command
-            import subprocess
+            # Method 1: Get the root filesystem's disk from its device number
             try:
-                result = subprocess.run(['df', '-h', '/'], capture_output=True, text=True, check=True)
-                lines = result.stdout.strip().split('\n')
-                if len(lines) > 1:
-                    root_device = lines[1].split()[0]
-                    if root_device.startswith('/dev/'):
-                        # Extract disk device (remove partition number)
-                        disk_device = ''.join(c for c in root_device if c.isalpha())
-                        if disk_device:
-                            system_disks.append(f"/dev/{disk_device}")
-            except subprocess.CalledProcessError:
+                root_disk = self._root_disk()
+                if root_disk:
+                    system_disks.append(root_disk)
+            except OSError:
                 pass
             
             # Method 2: Check all mounted system partitions
@@ -4,15 +4,62 @@ Handles automatic sudo permission requests and management
 """
 
 import os
+import re
 import subprocess
 import logging
 import getpass
 import sys
+import threading
 from typing import Tuple, Optional, List
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Block size for full-device dd passes; large blocks keep dd bandwidth-bound
+# instead of syscall-bound
+DD_BLOCK_SIZE = "4M"
+
+# Start of the encrypted data in cryptsetup luksDump output: LUKS1 reports it
+# in 512-byte sectors, LUKS2 in bytes for the first data segment
+_LUKS1_PAYLOAD_OFFSET = re.compile(r'^Payload offset:\s*(\d+)', re.MULTILINE)
+_LUKS2_SEGMENT_OFFSET = re.compile(r'Data segments:.*?\boffset:\s*(\d+)\s*\[bytes\]', re.DOTALL)
+
+
+def _queue_dir(device: str) -> Optional[str]:
+    """Return the sysfs queue directory of a disk, following a partition to its parent"""
+    sys_block = os.path.realpath(f"/sys/class/block/{os.path.basename(os.path.realpath(device))}")
+    if os.path.exists(os.path.join(sys_block, "partition")):
+        sys_block = os.path.dirname(sys_block)
+    queue = os.path.join(sys_block, "queue")
+    return queue if os.path.isdir(queue) else None
+
+
+def is_solid_state(device: str) -> bool:
+    """Check sysfs for a non-rotational (SSD/NVMe) device; False when unknown"""
+    queue = _queue_dir(device)
+    if not queue:
+        return False
+    try:
+        with open(os.path.join(queue, "rotational")) as f:
+            return f.read().strip() == "0"
+    except OSError:
+        return False
+
+
+def supports_discard(device: str) -> bool:
+    """Check sysfs for discard (TRIM) support; False when unknown so callers overwrite instead"""
+    # BLKDISCARDZEROES always reports no support on current kernels, so the
+    # queue limit is the reliable signal
+    queue = _queue_dir(device)
+    if not queue:
+        return False
+    try:
+        with open(os.path.join(queue, "discard_max_bytes")) as f:
+            return int(f.read().strip()) > 0
+    except (OSError, ValueError):
+        return False
+
+
 class SudoManager:
     """Manages sudo permissions and automatic privilege escalation"""
     
@@ -29,6 +76,8 @@ class SudoManager:
             self.has_sudo = self._check_sudo_availability()
             self.sudo_password = None
             self.sudo_cached = False
+            # Serializes password prompts when several wipes run in parallel
+            self._password_lock = threading.Lock()
             SudoManager._initialized = True
         
     def _check_sudo_availability(self) -> bool:
@@ -91,6 +140,15 @@ class SudoManager:
             logger.error(f"Error requesting sudo password: {e}")
             return None
     
+    def ensure_privileges(self) -> bool:
+        """Settle how commands get root up front, so no prompt appears mid-operation"""
+        if os.name != 'posix' or os.geteuid() == 0 or self._check_passwordless_sudo('true'):
+            return True
+        with self._password_lock:
+            if not self.sudo_cached:
+                self.request_sudo_password()
+            return self.sudo_cached
+    
     def _test_sudo_password(self, password: str) -> bool:
         """Test if the provided sudo password is valid"""
         try:
@@ -140,8 +198,8 @@ class SudoManager:
                     return True, result.stdout, result.stderr
             
             # If passwordless sudo doesn't work, request password
-            if not self.sudo_cached:
-                password = self.request_sudo_password()
+            with self._password_lock:
+                password = self.sudo_password if self.sudo_cached else self.request_sudo_password()
                 if not password:
                     # Provide helpful error message
                     error_msg = (
@@ -155,7 +213,7 @@ class SudoManager:
             sudo_cmd = ['sudo', '-S'] + command
             result = subprocess.run(
                 sudo_cmd,
-                input=self.sudo_password + '\n',
+                input=password + '\n',
                 capture_output=True,
                 text=True,
                 timeout=timeout
@@ -239,8 +297,9 @@ class SudoManager:
         except Exception:
             return []
     
-    def wipe_disk_with_sudo(self, device: str, method: str, passes: int) -> Tuple[bool, str]:
-        """Wipe a disk with automatic sudo handling"""
+    def wipe_disk_with_sudo(self, device: str, method: str, passes: int,
+                            luks_data_offset: Optional[int] = None) -> Tuple[bool, str]:
+        """Wipe a disk with automatic sudo handling; luks-erase needs the offset from luks_data_offset()"""
         try:
             print(f"\n🗑️ Starting disk wipe operation...")
             print(f"Device: {device}")
@@ -262,14 +321,35 @@ class SudoManager:
                 return self._wipe_with_dd_sudo(device, passes)
             elif method == "quick":
                 return self._wipe_quick_sudo(device)
+            elif method == "blkdiscard":
+                if not supports_discard(device):
+                    return False, f"Device {device} does not support discard (TRIM); choose another method"
+                return self._wipe_with_blkdiscard_sudo(device)
             elif method == "secure":
                 return self._wipe_secure_sudo(device, passes)
+            elif method == "luks-erase":
+                return self._wipe_luks_header_sudo(device, luks_data_offset)
             else:
                 return False, f"Unsupported wipe method: {method}"
                 
         except Exception as e:
             return False, f"Error during wipe operation: {str(e)}"
     
+    def effective_method(self, device: str, method: str) -> str:
+        """Return the technique a wipe method will actually use on a device"""
+        # On SSDs discarding every block is as fast as clearing the signatures
+        # and also covers the whole device
+        if method == "quick" and is_solid_state(device) and supports_discard(device):
+            return "blkdiscard"
+        return method
+    
+    def _dd_fill_command(self, source: str, device: str, size_bytes: int) -> List[str]:
+        """Build a dd command that overwrites exactly size_bytes of device from source"""
+        # count_bytes makes count a byte total, so the last partial block of the
+        # device is covered; fullblock guards against short reads from source
+        return ['dd', f'if={source}', f'of={device}', f'bs={DD_BLOCK_SIZE}', f'count={size_bytes}',
+                'iflag=count_bytes,fullblock', 'status=progress', 'conv=fsync']
+    
     def _wipe_with_dd_sudo(self, device: str, passes: int) -> Tuple[bool, str]:
         """Wipe disk using dd with sudo"""
         try:
@@ -291,7 +371,7 @@ class SudoManager:
                 print(f"🔄 Wipe pass {pass_num + 1}/{passes}...")
                 
                 # Use dd with random data and proper count parameter
-                cmd = ['dd', f'if=/dev/urandom', f'of={device}', 'bs=1M', f'count={disk_size_mb}', 'status=progress', 'conv=fsync']
+                cmd = self._dd_fill_command('/dev/urandom', device, disk_size_bytes)
                 success, stdout, stderr = self.run_with_sudo(cmd, f"dd wipe pass {pass_num + 1}")
                 
                 if not success:
@@ -304,6 +384,75 @@ class SudoManager:
         except Exception as e:
             return False, f"DD wipe error: {str(e)}"
     
+    def _wipe_with_blkdiscard_sudo(self, device: str) -> Tuple[bool, str]:
+        """Discard (TRIM) every block of a device with sudo"""
+        try:
+            print("🔄 Discarding all blocks (TRIM)...")
+            
+            cmd = ['blkdiscard', '-f', device]
+            success, stdout, stderr = self.run_with_sudo(cmd, "discard all blocks")
+            
+            if success:
+                return True, "Disk wiped successfully using blkdiscard (all blocks discarded)"
+            else:
+                return False, f"blkdiscard failed: {stderr.strip()}"
+                
+        except Exception as e:
+            return False, f"blkdiscard error: {str(e)}"
+    
+    def luks_data_offset(self, device: str) -> Optional[int]:
+        """Return where the encrypted data of a LUKS device starts, in bytes, or None"""
+        success, stdout, stderr = self.run_with_sudo(['cryptsetup', 'luksDump', device], "read LUKS header")
+        if not success:
+            return None
+        
+        match = _LUKS2_SEGMENT_OFFSET.search(stdout)
+        if match:
+            return int(match.group(1))
+        match = _LUKS1_PAYLOAD_OFFSET.search(stdout)
+        if match:
+            return int(match.group(1)) * 512
+        return None
+    
+    def read_device_bytes(self, device: str, count: int) -> Optional[bytes]:
+        """Read the first count bytes of a device with sudo, or None if that fails"""
+        success, stdout, stderr = self.run_with_sudo(['od', '-An', '-tx1', '-N', str(count), device],
+                                                     "read device header")
+        if not success:
+            return None
+        try:
+            return bytes.fromhex(''.join(stdout.split()))
+        except ValueError:
+            return None
+    
+    def _wipe_luks_header_sudo(self, device: str, data_offset: Optional[int]) -> Tuple[bool, str]:
+        """Cryptographic erase: destroy every LUKS keyslot and the whole metadata area"""
+        try:
+            print("🔄 Erasing LUKS keyslots and header (cryptographic erase)...")
+            
+            # The metadata and keyslot areas are configurable, so the area to
+            # clear runs up to the data offset recorded in this header
+            if data_offset is None:
+                return False, "Cannot read the LUKS header (cryptsetup luksDump failed); nothing was erased"
+            
+            # luksErase destroys all keyslots wherever they are stored
+            success, stdout, stderr = self.run_with_sudo(['cryptsetup', 'luksErase', '-q', device],
+                                                         "erase LUKS keyslots")
+            if not success:
+                return False, f"LUKS keyslot erase failed: {stderr}"
+            
+            if data_offset:
+                cmd = self._dd_fill_command('/dev/zero', device, data_offset)
+                success, stdout, stderr = self.run_with_sudo(cmd, "LUKS header erase")
+                if not success:
+                    return False, f"LUKS keyslots erased, but zeroing the header area failed: {stderr}"
+            
+            return True, (f"Cryptographic erase completed (all LUKS keyslots erased, "
+                          f"{data_offset:,} header bytes zeroed)")
+                
+        except Exception as e:
+            return False, f"LUKS header erase error: {str(e)}"
+    
     def _wipe_quick_sudo(self, device: str) -> Tuple[bool, str]:
         """Quick wipe - only wipe first and last 10MB for speed"""
         try:
@@ -353,10 +502,10 @@ class SudoManager:
                 
                 if pass_num == 0:
                     # First pass with zeros
-                    cmd = ['dd', f'if=/dev/zero', f'of={device}', 'bs=1M', f'count={disk_size_mb}', 'status=progress', 'conv=fsync']
+                    cmd = self._dd_fill_command('/dev/zero', device, disk_size_bytes)
                 else:
                     # Subsequent passes with random data
-                    cmd = ['dd', f'if=/dev/urandom', f'of={device}', 'bs=1M', f'count={disk_size_mb}', 'status=progress', 'conv=fsync']
+                    cmd = self._dd_fill_command('/dev/urandom', device, disk_size_bytes)
                 
                 success, stdout, stderr = self.run_with_sudo(cmd, f"secure wipe pass {pass_num + 1}")
                 
@@ -201,18 +201,22 @@ class VerificationManager:
         except Exception as e:
             logger.error(f"Error saving verification proof: {e}")
     
+    def _load_proof(self, proof_file: Path) -> Optional[Dict]:
+        """Load one proof file, or None if it cannot be read"""
+        try:
+            with open(proof_file, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Error reading proof file {proof_file}: {e}")
+            return None
+    
     def get_verification_history(self) -> List[Dict]:
         """Get history of all verification operations"""
         try:
-            history = []
-            
-            for proof_file in self.proof_directory.glob("*.json"):
-                try:
-                    with open(proof_file, 'r') as f:
-                        verification_record = json.load(f)
-                        history.append(verification_record)
-                except Exception as e:
-                    logger.error(f"Error reading proof file {proof_file}: {e}")
+            # json.load holds the GIL, so the files are parsed in turn; a
+            # thread pool measured slower than this loop
+            history = [record for record in map(self._load_proof, self.proof_directory.glob("*.json"))
+                       if record is not None]
             
             # Sort by timestamp (newest first)
             history.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
@@ -495,15 +495,17 @@ class EnhancedMainWindow:
         
         try:
             # Get available disks
+            self.disk_manager.refresh_system_disks()
             disks = self.disk_manager.get_available_disks()
             system_disks = self.disk_manager.get_system_disks()
+            statuses = self.disk_manager.get_disk_status_batch([disk.device for disk in disks])
             
             for disk in disks:
                 # Use enhanced data model properties
                 size_str = disk.size_formatted if hasattr(disk, 'size_formatted') else f"{disk.size // (1024**3)}GB"
                 
                 # Get intelligent disk analysis
-                disk_status = self.disk_manager.get_disk_status_safe(disk.device)
+                disk_status = statuses[disk.device]
                 is_writable = disk_status['is_writable']
                 is_system_disk = disk_status['is_protected']
                 safety_level = disk_status.get('safety_level', 'unknown')
@@ -783,50 +785,51 @@ RECOMMENDATIONS
             hpa_dco_info = self.disk_manager.detect_hpa_dco(device)
             
             # Build HPA/DCO display text
-            hpa_dco_text = f"HPA/DCO Analysis for {device}\n"
-            hpa_dco_text += "=" * 50 + "\n"
+            parts = [f"HPA/DCO Analysis for {device}\n", "=" * 50 + "\n"]
             
             if hpa_dco_info.get('error'):
-                hpa_dco_text += f"Error: {hpa_dco_info['error']}\n"
+                parts.append(f"Error: {hpa_dco_info['error']}\n")
             else:
                 # Detection method
-                hpa_dco_text += f"Detection Method: {hpa_dco_info.get('detection_method', 'N/A')}\n\n"
+                parts.append(f"Detection Method: {hpa_dco_info.get('detection_method', 'N/A')}\n\n")
                 
                 # Sector information
-                hpa_dco_text += "Sector Information:\n"
-                hpa_dco_text += f"  Current Max Sectors: {hpa_dco_info.get('current_max_sectors', 0):,}\n"
-                hpa_dco_text += f"  Native Max Sectors:  {hpa_dco_info.get('native_max_sectors', 0):,}\n"
-                hpa_dco_text += f"  Accessible Sectors:  {hpa_dco_info.get('accessible_sectors', 0):,}\n\n"
+                parts.append("Sector Information:\n")
+                parts.append(f"  Current Max Sectors: {hpa_dco_info.get('current_max_sectors', 0):,}\n")
+                parts.append(f"  Native Max Sectors:  {hpa_dco_info.get('native_max_sectors', 0):,}\n")
+                parts.append(f"  Accessible Sectors:  {hpa_dco_info.get('accessible_sectors', 0):,}\n\n")
                 
                 # HPA detection
                 if hpa_dco_info.get('hpa_detected'):
                     hpa_sectors = hpa_dco_info.get('hpa_sectors', 0)
                     hpa_gb = (hpa_sectors * 512) / (1024**3)
-                    hpa_dco_text += f"⚠️  HPA DETECTED!\n"
-                    hpa_dco_text += f"  Hidden Sectors: {hpa_sectors:,}\n"
-                    hpa_dco_text += f"  Hidden Size: {hpa_gb:.2f} GB\n"
-                    hpa_dco_text += f"  Can Remove: {'Yes' if hpa_dco_info.get('can_remove_hpa') else 'No'}\n\n"
+                    parts.append(f"⚠️  HPA DETECTED!\n")
+                    parts.append(f"  Hidden Sectors: {hpa_sectors:,}\n")
+                    parts.append(f"  Hidden Size: {hpa_gb:.2f} GB\n")
+                    parts.append(f"  Can Remove: {'Yes' if hpa_dco_info.get('can_remove_hpa') else 'No'}\n\n")
                 else:
-                    hpa_dco_text += "✓ No HPA detected\n\n"
+                    parts.append("✓ No HPA detected\n\n")
                 
                 # DCO detection
                 if hpa_dco_info.get('dco_detected'):
                     dco_sectors = hpa_dco_info.get('dco_sectors', 0)
                     dco_gb = (dco_sectors * 512) / (1024**3)
-                    hpa_dco_text += f"⚠️  DCO DETECTED!\n"
-                    hpa_dco_text += f"  DCO Sectors: {dco_sectors:,}\n"
-                    hpa_dco_text += f"  DCO Size: {dco_gb:.2f} GB\n"
-                    hpa_dco_text += f"  Can Remove: {'Yes' if hpa_dco_info.get('can_remove_dco') else 'No'}\n\n"
+                    parts.append(f"⚠️  DCO DETECTED!\n")
+                    parts.append(f"  DCO Sectors: {dco_sectors:,}\n")
+                    parts.append(f"  DCO Size: {dco_gb:.2f} GB\n")
+                    parts.append(f"  Can Remove: {'Yes' if hpa_dco_info.get('can_remove_dco') else 'No'}\n\n")
                 else:
-                    hpa_dco_text += "✓ No DCO detected\n\n"
+                    parts.append("✓ No DCO detected\n\n")
                 
                 # Summary
                 total_hidden = hpa_dco_info.get('hpa_sectors', 0) + hpa_dco_info.get('dco_sectors', 0)
                 if total_hidden > 0:
                     total_hidden_gb = (total_hidden * 512) / (1024**3)
-                    hpa_dco_text += f"Total Hidden Capacity: {total_hidden_gb:.2f} GB"
+                    parts.append(f"Total Hidden Capacity: {total_hidden_gb:.2f} GB")
                 else:
-                    hpa_dco_text += "No hidden areas detected"
+                    parts.append("No hidden areas detected")
+            
+            hpa_dco_text = "".join(parts)
             
             # Update display
             self.hpa_dco_display.config(state=tk.NORMAL)
@@ -922,6 +925,7 @@ RECOMMENDATIONS
             return
         
         # Enhanced safety checks
+        self.disk_manager.refresh_system_disks()
         system_disks = self.disk_manager.get_system_disks()
         if self.selected_disk in system_disks:
             messagebox.showerror("CRITICAL ERROR", 